@@ -14,16 +14,54 @@ from utils.config import (
 logger = logging.getLogger(__name__)
 
 
+def _compile_keywords(keywords: List[str]) -> Optional[re.Pattern]:
+    """Compile a lowercase keyword list into one substring alternation."""
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Experience patterns, compiled once at import instead of per filter_job call.
+# Joined into single alternations so each check is one C-level scan of the
+# text rather than a Python loop of re.search calls.
+_EXPERIENCE_MENTION_RE = re.compile("|".join((
+    r'\b(0|zero)\s*(to|-)?\s*[1-2]\s*(years?|yrs?)\b',
+    r'\b[1-5]\+\s*(years?|yrs?)\b',
+    r'\b[1-5]\s*(to|-)\s*[1-9]\s*(years?|yrs?)\b',
+    r'\bfresher\b',
+    r'\bentry\s*level\b',
+    r'\bjunior\b',
+)))
+
+# Patterns that indicate too much experience (e.g., "4+ years", "senior")
+_SENIOR_RE = re.compile("|".join((
+    r'\b[4-9]\+\s*(years?|yrs?)\b',
+    r'\b(1[0-9]|[2-9][0-9])\+\s*(years?|yrs?)\b',
+    r'\bsenior\b',
+    r'\blead\b',
+    r'\bprincipal\b',
+    r'\barchitect\b',
+)))
+
+# "1 year", "2 years", etc. (1-3 years is acceptable)
+_REASONABLE_EXP_RE = re.compile(r'\b([1-3])\s*(years?|yrs?)\b')
+
+
 class JobFilter:
     """Filter jobs based on location, role, and experience criteria."""
-    
+
     def __init__(self):
         """Initialize the job filter."""
         self.search_terms = [term.lower() for term in SEARCH_TERMS]
         self.locations = [loc.lower() for loc in INDIA_LOCATIONS]
         self.experience_levels = [exp.lower() for exp in EXPERIENCE_LEVELS]
         self.exclude_keywords = [kw.lower() for kw in EXCLUDE_KEYWORDS]
-    
+        # Precompiled keyword alternations for the hot substring checks
+        self._search_terms_re = _compile_keywords(self.search_terms)
+        self._locations_re = _compile_keywords(self.locations)
+        self._experience_levels_re = _compile_keywords(self.experience_levels)
+        self._exclude_re = _compile_keywords(self.exclude_keywords)
+
     def matches_role(self, job_title: str, job_description: str = "") -> bool:
         """
         Check if job matches Software Engineer role.
@@ -36,13 +74,10 @@ class JobFilter:
             True if job matches role criteria
         """
         text = f"{job_title} {job_description}".lower()
-        
+
         # Check if any search term is in the text
-        for term in self.search_terms:
-            if term in text:
-                return True
-        
-        return False
+        return self._search_terms_re is not None and \
+            self._search_terms_re.search(text) is not None
     
     def matches_location(self, location: str) -> bool:
         """
@@ -58,13 +93,10 @@ class JobFilter:
             return False
         
         location_lower = location.lower()
-        
+
         # Check if location contains any of the India/Remote keywords
-        for loc in self.locations:
-            if loc in location_lower:
-                return True
-        
-        return False
+        return self._locations_re is not None and \
+            self._locations_re.search(location_lower) is not None
     
     def is_experience_eligible(self, job_title: str, job_description: str = "") -> bool:
         """
@@ -79,59 +111,33 @@ class JobFilter:
             True if job is eligible (fresher or 1+ years, not internship)
         """
         text = f"{job_title} {job_description}".lower()
-        
-        # Exclude internships
-        for exclude_kw in self.exclude_keywords:
-            if exclude_kw in text:
-                # Allow if it's explicitly "full-time" or "permanent"
-                if "full-time" in text or "permanent" in text:
-                    continue
+
+        # Exclude internships, unless explicitly "full-time" or "permanent"
+        if self._exclude_re is not None and self._exclude_re.search(text):
+            if "full-time" not in text and "permanent" not in text:
                 return False
-        
+
         # Check for experience requirements
         # Look for patterns like "0-1 years", "1+ years", "fresher", etc.
-        experience_patterns = [
-            r'\b(0|zero)\s*(to|-)?\s*[1-2]\s*(years?|yrs?)\b',
-            r'\b[1-5]\+\s*(years?|yrs?)\b',
-            r'\b[1-5]\s*(to|-)\s*[1-9]\s*(years?|yrs?)\b',
-            r'\bfresher\b',
-            r'\bentry\s*level\b',
-            r'\bjunior\b',
-        ]
-        
         # If no explicit experience mentioned, assume it's eligible
-        has_experience_mention = any(re.search(pattern, text) for pattern in experience_patterns)
-        
-        if not has_experience_mention:
+        if not _EXPERIENCE_MENTION_RE.search(text):
             # If no experience mentioned, include it (might be fresher or 1+)
             return True
-        
+
         # Check if it matches our experience levels
-        for exp_level in self.experience_levels:
-            if exp_level in text:
-                return True
-        
-        # Check for patterns that indicate too much experience (e.g., "4+ years", "senior")
-        senior_patterns = [
-            r'\b[4-9]\+\s*(years?|yrs?)\b',
-            r'\b(1[0-9]|[2-9][0-9])\+\s*(years?|yrs?)\b',
-            r'\bsenior\b',
-            r'\blead\b',
-            r'\bprincipal\b',
-            r'\barchitect\b',
-        ]
-        
+        if self._experience_levels_re is not None and \
+                self._experience_levels_re.search(text):
+            return True
+
         # If it's clearly senior level, exclude it
-        for pattern in senior_patterns:
-            if re.search(pattern, text):
-                return False
-        
-        # If experience is mentioned but doesn't match our criteria, check if it's reasonable
-        # Look for "1 year", "2 years", etc. (1-3 years is acceptable)
-        reasonable_exp = re.search(r'\b([1-3])\s*(years?|yrs?)\b', text)
-        if reasonable_exp:
+        if _SENIOR_RE.search(text):
+            return False
+
+        # If experience is mentioned but doesn't match our criteria, check if
+        # it's reasonable (1-3 years is acceptable)
+        if _REASONABLE_EXP_RE.search(text):
             return True
-        
+
         # Default: include if no clear exclusion
         return True
     
@@ -1,108 +1,191 @@
 #!/usr/bin/env python3
 """Main script to scrape jobs from company career pages."""
 
+import os
 import sys
+import time
+import heapq
 import logging
-from scrapers.company_careers_scraper import CompanyCareersScraper
-from scrapers.linkedin_scraper import LinkedInScraper
-from scrapers.naukri_scraper import NaukriScraper
-from scrapers.indeed_scraper import IndeedScraper
-from scrapers.remoteok_scraper import RemoteOKScraper
-from scrapers.weworkremotely_scraper import WeWorkRemotelyScraper
-from scrapers.remotive_scraper import RemotiveScraper
-from scrapers.himalayas_scraper import HimalayasScraper
-from scrapers.additional_remote_scrapers import (
-    OttaScraper,
-    JobspressoScraper,
-    DynamiteJobsScraper,
-    WorkingNomadsScraper,
-    RemoteSourceScraper,
-    NoVisaJobsScraper,
-    WorldTeamsScraper,
-    RemoteRebellionScraper,
-    YCombinatorJobsScraper,
-    FlexaScraper,
-    RemoteCoScraper,
-    DailyRemoteScraper,
-    RemoteIoScraper,
-    RemoteHubScraper,
-    RemotersMeScraper,
-    JustRemoteScraper,
-    SkipTheDriveScraper,
-    GrowmotelyScraper,
-    RemotewxScraper,
-    PangianScraper,
-)
-from scrapers.gated_scrapers import (
-    WellfoundScraper,
-    CutshortScraper,
-    InstahyreScraper,
-    HiristIIMJobsScraper,
-    ArcScraper,
-    FlexJobsScraper,
-)
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
 from filters.job_filter import JobFilter
 from utils.csv_writer import CSVWriter
 from utils.job_scorer import JobScorer
-from utils.config import CSV_HISTORY_DIR, ENABLE_GATED_SCRAPERS, SEARCH_LOCATIONS
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+from utils.job_record import JobRecord
+from utils.config import (
+    CSV_HISTORY_DIR,
+    ENABLE_GATED_SCRAPERS,
+    SEARCH_LOCATIONS,
+    SCRAPER_TIMEOUT_S,
+    SCRAPER_MAX_WORKERS,
+    PROCESS_POOL_MIN_JOBS,
 )
+
 logger = logging.getLogger(__name__)
 
 
+def _configure_logging():
+    """
+    Configure root logging for a scraper run.
+
+    Called from the entry point rather than at import so importing main as a
+    module (tests, tooling) doesn't reconfigure the process's logging.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+# Set SCRAPER_VERBOSE=0 to silence the per-scraper diagnostics sections on
+# scheduled (cron/CI) runs; errors and totals still go through the logger
+VERBOSE = os.getenv('SCRAPER_VERBOSE', '1') != '0'
+
+# Section banner pieces, written as single buffered strings instead of one
+# print (and one potential flush) per decoration line
+HDR = "=" * 60
+SEP = "-" * 60
+
+
+# Per-process scorer instance for the process pool, built once per worker by
+# the initializer instead of once per chunk
+_worker_scorer = None
+
+
+def _init_score_worker():
+    """Initialize the scorer in a process pool worker."""
+    global _worker_scorer
+    _worker_scorer = JobScorer()
+
+
+def _score_chunk(records):
+    """Score a chunk of JobRecords in a worker process."""
+    for record in records:
+        try:
+            _worker_scorer.score_record(record)
+        except Exception as e:
+            logger.warning(f"Error scoring job {record.title or 'Unknown'}: {e}")
+            record.priority_score = 0
+            record.freshness = 'Unknown'
+    return records
+
+
+def _map_in_processes(fn, items):
+    """
+    Shard items into one contiguous chunk per core, run fn over the chunks
+    in a process pool, and concatenate the results in order.
+
+    Scoring is regex/date math (CPU-bound), so threads don't help here;
+    processes bypass the GIL at the cost of pickling the chunks.
+    """
+    nproc = os.cpu_count() or 1
+    chunk_size = max(1, -(-len(items) // nproc))
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=len(chunks), initializer=_init_score_worker
+    ) as pool:
+        for chunk_result in pool.map(fn, chunks):
+            results.extend(chunk_result)
+    return results
+
+
 def main():
     """Main function to orchestrate job scraping."""
-    print("=" * 60)
-    print("Job Scraper - Company Career Pages")
-    print("=" * 60)
-    print()
-    
+    # Scraper modules are imported lazily so cold start (cron/CI) doesn't pay
+    # for ~35 scraper modules before any work happens; the gated scrapers and
+    # their heavier transitive deps are skipped entirely when disabled
+    from scrapers.company_careers_scraper import CompanyCareersScraper
+    from scrapers.linkedin_scraper import LinkedInScraper
+    from scrapers.naukri_scraper import NaukriScraper
+    from scrapers.indeed_scraper import IndeedScraper
+    from scrapers.remoteok_scraper import RemoteOKScraper
+    from scrapers.weworkremotely_scraper import WeWorkRemotelyScraper
+    from scrapers.remotive_scraper import RemotiveScraper
+    from scrapers.himalayas_scraper import HimalayasScraper
+    from scrapers.additional_remote_scrapers import (
+        OttaScraper,
+        JobspressoScraper,
+        DynamiteJobsScraper,
+        WorkingNomadsScraper,
+        RemoteSourceScraper,
+        NoVisaJobsScraper,
+        WorldTeamsScraper,
+        RemoteRebellionScraper,
+        YCombinatorJobsScraper,
+        FlexaScraper,
+        RemoteCoScraper,
+        DailyRemoteScraper,
+        RemoteIoScraper,
+        RemoteHubScraper,
+        RemotersMeScraper,
+        JustRemoteScraper,
+        SkipTheDriveScraper,
+        GrowmotelyScraper,
+        RemotewxScraper,
+        PangianScraper,
+    )
+
+    sys.stdout.write(f"{HDR}\nJob Scraper - Company Career Pages\n{HDR}\n\n")
+
     # Initialize components
     try:
         company_scraper = CompanyCareersScraper()
         linkedin_scraper = LinkedInScraper()
         naukri_scraper = NaukriScraper()
         indeed_scraper = IndeedScraper()
-        remoteok_scraper = RemoteOKScraper()
-        wwr_scraper = WeWorkRemotelyScraper()
-        remotive_scraper = RemotiveScraper()
-        himalayas_scraper = HimalayasScraper()
-        
-        # Additional remote job board scrapers
-        otta_scraper = OttaScraper()
-        jobspresso_scraper = JobspressoScraper()
-        dynamite_jobs_scraper = DynamiteJobsScraper()
-        working_nomads_scraper = WorkingNomadsScraper()
-        remote_source_scraper = RemoteSourceScraper()
-        no_visa_jobs_scraper = NoVisaJobsScraper()
-        world_teams_scraper = WorldTeamsScraper()
-        remote_rebellion_scraper = RemoteRebellionScraper()
-        yc_jobs_scraper = YCombinatorJobsScraper()
-        flexa_scraper = FlexaScraper()
-        remote_co_scraper = RemoteCoScraper()
-        daily_remote_scraper = DailyRemoteScraper()
-        remote_io_scraper = RemoteIoScraper()
-        remote_hub_scraper = RemoteHubScraper()
-        remoters_me_scraper = RemotersMeScraper()
-        just_remote_scraper = JustRemoteScraper()
-        skip_the_drive_scraper = SkipTheDriveScraper()
-        growmotely_scraper = GrowmotelyScraper()
-        remotewx_scraper = RemotewxScraper()
-        pangian_scraper = PangianScraper()
-
-        gated_scrapers = []
+        # Data-driven registry for the standalone boards: one
+        # (stats key, scraper, scrape kwargs) entry each, iterated by a
+        # single submit loop instead of a near-identical block per scraper
+        board_scrapers = [
+            ('RemoteOK', RemoteOKScraper(), {'max_results': 100}),
+            ('We Work Remotely', WeWorkRemotelyScraper(), {'max_results': 100}),
+            ('Remotive', RemotiveScraper(), {'max_results': 100}),
+            ('Himalayas', HimalayasScraper(), {'max_results': 100}),
+            ('Otta', OttaScraper(), {'max_results': 100}),
+            ('Jobspresso', JobspressoScraper(), {'max_results': 100}),
+            ('Dynamite Jobs', DynamiteJobsScraper(), {'max_results': 100}),
+            ('Working Nomads', WorkingNomadsScraper(), {'max_results': 100}),
+            ('RemoteSource', RemoteSourceScraper(), {'max_results': 100}),
+            ('No Visa Jobs', NoVisaJobsScraper(), {'max_results': 100}),
+            ('World Teams', WorldTeamsScraper(), {'max_results': 100}),
+            ('Remote Rebellion', RemoteRebellionScraper(), {'max_results': 100}),
+            ('Y Combinator Jobs', YCombinatorJobsScraper(), {'max_results': 100}),
+            ('Flexa', FlexaScraper(), {'max_results': 100}),
+            ('Remote.co', RemoteCoScraper(), {'max_results': 100}),
+            ('DailyRemote', DailyRemoteScraper(), {'max_results': 100}),
+            ('remote.io', RemoteIoScraper(), {'max_results': 100}),
+            ('RemoteHub', RemoteHubScraper(), {'max_results': 100}),
+            ('Remoters.me', RemotersMeScraper(), {'max_results': 100}),
+            ('JustRemote', JustRemoteScraper(), {'max_results': 100}),
+            ('SkipTheDrive', SkipTheDriveScraper(), {'max_results': 100}),
+            ('Growmotely', GrowmotelyScraper(), {'max_results': 100}),
+            ('Remotewx', RemotewxScraper(), {'max_results': 100}),
+            ('Pangian', PangianScraper(), {'max_results': 100}),
+        ]
+
         if ENABLE_GATED_SCRAPERS:
-            gated_scrapers = [
-                WellfoundScraper(),
-                CutshortScraper(),
-                InstahyreScraper(),
-                HiristIIMJobsScraper(),
-                ArcScraper(),
-                FlexJobsScraper(),
-            ]
+            from scrapers.gated_scrapers import (
+                WellfoundScraper,
+                CutshortScraper,
+                InstahyreScraper,
+                HiristIIMJobsScraper,
+                ArcScraper,
+                FlexJobsScraper,
+            )
+            board_scrapers.extend(
+                (cls.__name__, cls(), {'max_results': 50})
+                for cls in (
+                    WellfoundScraper,
+                    CutshortScraper,
+                    InstahyreScraper,
+                    HiristIIMJobsScraper,
+                    ArcScraper,
+                    FlexJobsScraper,
+                )
+            )
         job_filter = JobFilter()
         csv_writer = CSVWriter()
         job_scorer = JobScorer()
@@ -113,7 +196,7 @@ def main():
     
     # Get existing URLs to avoid duplicates
     try:
-        existing_urls = csv_writer.get_existing_urls()
+        existing_urls = csv_writer.get_existing_urls_cached()
         print(f"Found {len(existing_urls)} existing jobs in CSV (for deduplication)")
         print()
     except Exception as e:
@@ -121,273 +204,212 @@ def main():
         existing_urls = set()
         print("Starting fresh (could not read existing CSV)")
         print()
-    
-    # Scrape jobs from all sources
-    all_jobs = []
+
+    # Scrape jobs from all sources concurrently. Every scraper task goes onto
+    # the shared pool up front so slow sources overlap instead of running
+    # back to back; results are collected in completion order.
+    # Per-batch filtered lists; downstream passes chain over them lazily
+    # instead of copying every batch into one ever-reallocating list
+    filtered_parts = []
+    total_scraped = 0
     scraper_stats = {}  # Track jobs per scraper before filtering
-    
-    # 1. Company career pages (primary source)
-    print("1. Scraping company career pages...")
-    print("-" * 60)
-    try:
-        company_jobs = company_scraper.scrape()
-        all_jobs.extend(company_jobs)
-        scraper_stats['Company Career Pages'] = len(company_jobs)
-        print(f"   Found {len(company_jobs)} jobs from company career pages")
-    except Exception as e:
-        logger.error(f"Error scraping company career pages: {e}")
-        scraper_stats['Company Career Pages'] = 0
-        print(f"   Error: {e}")
-    print()
-    
-    # 2. LinkedIn (search multiple locations: India + Gulf countries)
-    print("2. Scraping LinkedIn...")
-    print("-" * 60)
-    try:
-        linkedin_jobs = []
-        for location in SEARCH_LOCATIONS:
-            try:
-                location_jobs = linkedin_scraper.scrape(location=location, max_results=50)
-                linkedin_jobs.extend(location_jobs)
-                logger.info(f"LinkedIn: Found {len(location_jobs)} jobs in {location}")
-            except Exception as e:
-                logger.warning(f"LinkedIn: Error searching {location}: {e}")
-                continue
-        all_jobs.extend(linkedin_jobs)
-        scraper_stats['LinkedIn'] = len(linkedin_jobs)
-        print(f"   Found {len(linkedin_jobs)} jobs from LinkedIn (across {len(SEARCH_LOCATIONS)} locations)")
-    except Exception as e:
-        logger.error(f"Error scraping LinkedIn: {e}")
-        scraper_stats['LinkedIn'] = 0
-        print(f"   Error: {e}")
-    print()
-    
-    # 3. Naukri (search multiple locations: India + Gulf countries)
-    print("3. Scraping Naukri...")
-    print("-" * 60)
-    try:
-        naukri_jobs = []
-        # Naukri primarily serves India, but also search for Gulf countries
-        for location in SEARCH_LOCATIONS:
-            try:
-                # For Naukri, use location name directly
-                location_jobs = naukri_scraper.scrape(location=location.lower(), max_results=50)
-                naukri_jobs.extend(location_jobs)
-                logger.info(f"Naukri: Found {len(location_jobs)} jobs in {location}")
-            except Exception as e:
-                logger.warning(f"Naukri: Error searching {location}: {e}")
-                continue
-        all_jobs.extend(naukri_jobs)
-        scraper_stats['Naukri'] = len(naukri_jobs)
-        print(f"   Found {len(naukri_jobs)} jobs from Naukri (across {len(SEARCH_LOCATIONS)} locations)")
-    except Exception as e:
-        logger.error(f"Error scraping Naukri: {e}")
-        scraper_stats['Naukri'] = 0
-        print(f"   Error: {e}")
-    print()
-    
-    # 4. Indeed (search multiple locations: India + Gulf countries)
-    print("4. Scraping Indeed...")
-    print("-" * 60)
-    try:
-        indeed_jobs = []
-        for location in SEARCH_LOCATIONS:
-            try:
-                location_jobs = indeed_scraper.scrape(location=location, max_results=50)
-                indeed_jobs.extend(location_jobs)
-                logger.info(f"Indeed: Found {len(location_jobs)} jobs in {location}")
-            except Exception as e:
-                logger.warning(f"Indeed: Error searching {location}: {e}")
-                continue
-        all_jobs.extend(indeed_jobs)
-        scraper_stats['Indeed'] = len(indeed_jobs)
-        print(f"   Found {len(indeed_jobs)} jobs from Indeed (across {len(SEARCH_LOCATIONS)} locations)")
-    except Exception as e:
-        logger.error(f"Error scraping Indeed: {e}")
-        scraper_stats['Indeed'] = 0
-        print(f"   Error: {e}")
-    print()
+    # get_existing_urls() already returns a fresh set, so adopt it as the live
+    # dedup set instead of rehashing every URL into a copy; remember whether
+    # the CSV had rows before scraped URLs start landing in it
+    had_existing_jobs = bool(existing_urls)
+    seen_urls = existing_urls if isinstance(existing_urls, set) else set(existing_urls)
+    executor = ThreadPoolExecutor(max_workers=SCRAPER_MAX_WORKERS)
+    scrape_futures = {}  # future -> (stats key, human-readable task label)
+    task_starts = {}  # future -> [monotonic start], stamped when the task runs
 
-    # 5. RemoteOK
-    print("5. Scraping RemoteOK...")
-    print("-" * 60)
-    try:
-        remoteok_jobs = remoteok_scraper.scrape(max_results=100)
-        all_jobs.extend(remoteok_jobs)
-        scraper_stats['RemoteOK'] = len(remoteok_jobs)
-        print(f"   Found {len(remoteok_jobs)} jobs from RemoteOK")
-    except Exception as e:
-        logger.error(f"Error scraping RemoteOK: {e}")
-        scraper_stats['RemoteOK'] = 0
-        print(f"   Error: {e}")
-    print()
+    def _submit(stat_name, label, fn, **kwargs):
+        scraper_stats.setdefault(stat_name, 0)
+        start_cell = []
 
-    # 6. We Work Remotely
-    print("6. Scraping We Work Remotely...")
-    print("-" * 60)
-    try:
-        wwr_jobs = wwr_scraper.scrape(max_results=100)
-        all_jobs.extend(wwr_jobs)
-        scraper_stats['We Work Remotely'] = len(wwr_jobs)
-        print(f"   Found {len(wwr_jobs)} jobs from We Work Remotely")
-    except Exception as e:
-        logger.error(f"Error scraping We Work Remotely: {e}")
-        scraper_stats['We Work Remotely'] = 0
-        print(f"   Error: {e}")
-    print()
+        def _timed_task():
+            # Stamp when the task actually starts running, not when it was
+            # queued, so SCRAPER_TIMEOUT_S caps scraper time rather than
+            # time spent waiting for a worker thread
+            start_cell.append(time.monotonic())
+            return fn(**kwargs)
 
-    # 7. Remotive
-    print("7. Scraping Remotive...")
-    print("-" * 60)
-    try:
-        remotive_jobs = remotive_scraper.scrape(max_results=100)
-        all_jobs.extend(remotive_jobs)
-        scraper_stats['Remotive'] = len(remotive_jobs)
-        print(f"   Found {len(remotive_jobs)} jobs from Remotive")
-    except Exception as e:
-        logger.error(f"Error scraping Remotive: {e}")
-        scraper_stats['Remotive'] = 0
-        print(f"   Error: {e}")
-    print()
+        future = executor.submit(_timed_task)
+        scrape_futures[future] = (stat_name, label)
+        task_starts[future] = start_cell
 
-    # 8. Himalayas
-    print("8. Scraping Himalayas...")
-    print("-" * 60)
-    try:
-        himalayas_jobs = himalayas_scraper.scrape(max_results=100)
-        all_jobs.extend(himalayas_jobs)
-        scraper_stats['Himalayas'] = len(himalayas_jobs)
-        print(f"   Found {len(himalayas_jobs)} jobs from Himalayas")
-    except Exception as e:
-        logger.error(f"Error scraping Himalayas: {e}")
-        scraper_stats['Himalayas'] = 0
-        print(f"   Error: {e}")
-    print()
+    def _collect(jobs):
+        # Dedupe and filter each batch as it lands instead of buffering every
+        # raw job until the end: memory holds only jobs that survive both
+        # passes, and filter CPU overlaps with scrapers still running in the
+        # pool. scraper_stats keeps the raw per-source counts for diagnostics.
+        if not jobs:
+            # Errored/empty sources contribute nothing; skip straight out
+            return
+        seen = seen_urls
+        mark_seen = seen.add
+        unique = []
+        for job in jobs:
+            # Scrapers always emit str URLs, so no defensive str() cast here
+            url = (job.get('url') or '').strip()
+            if url and url not in seen:
+                mark_seen(url)
+                unique.append(job)
+        if unique:
+            filtered_parts.append(job_filter.filter_jobs(unique))
 
-    # 9. Additional Remote Job Boards
-    additional_remote_scrapers = [
-        ("Otta", otta_scraper),
-        ("Jobspresso", jobspresso_scraper),
-        ("Dynamite Jobs", dynamite_jobs_scraper),
-        ("Working Nomads", working_nomads_scraper),
-        ("RemoteSource", remote_source_scraper),
-        ("No Visa Jobs", no_visa_jobs_scraper),
-        ("World Teams", world_teams_scraper),
-        ("Remote Rebellion", remote_rebellion_scraper),
-        ("Y Combinator Jobs", yc_jobs_scraper),
-        ("Flexa", flexa_scraper),
-        ("Remote.co", remote_co_scraper),
-        ("DailyRemote", daily_remote_scraper),
-        ("remote.io", remote_io_scraper),
-        ("RemoteHub", remote_hub_scraper),
-        ("Remoters.me", remoters_me_scraper),
-        ("JustRemote", just_remote_scraper),
-        ("SkipTheDrive", skip_the_drive_scraper),
-        ("Growmotely", growmotely_scraper),
-        ("Remotewx", remotewx_scraper),
-        ("Pangian", pangian_scraper),
-    ]
-    
-    for idx, (scraper_name, scraper) in enumerate(additional_remote_scrapers, start=1):
-        print(f"9.{idx}. Scraping {scraper_name}...")
-        print("-" * 60)
-        try:
-            jobs = scraper.scrape(max_results=100)
-            all_jobs.extend(jobs)
-            scraper_stats[scraper_name] = len(jobs)
-            print(f"   Found {len(jobs)} jobs from {scraper_name}")
-        except Exception as e:
-            logger.error(f"Error scraping {scraper_name}: {e}")
-            scraper_stats[scraper_name] = 0
-            print(f"   Error: {e}")
-        print()
+    # Company career pages (primary source)
+    _submit('Company Career Pages', 'Company Career Pages', company_scraper.scrape)
+
+    # Job boards searched per location (India + Gulf countries); each
+    # (scraper, location) pair is an independent network-bound search.
+    # Per-scraper location massaging (Naukri wants lowercased names) is
+    # normalized once here, not per submitted task.
+    for scraper_name, scraper, locations in [
+        ('LinkedIn', linkedin_scraper, SEARCH_LOCATIONS),
+        ('Naukri', naukri_scraper, [loc.lower() for loc in SEARCH_LOCATIONS]),
+        ('Indeed', indeed_scraper, SEARCH_LOCATIONS),
+    ]:
+        for location in locations:
+            _submit(scraper_name, f"{scraper_name} ({location})",
+                    scraper.scrape, location=location, max_results=50)
+
+    # Standalone remote job boards (plus gated sources when enabled), all
+    # registered declaratively in board_scrapers
+    for scraper_name, scraper, scrape_kwargs in board_scrapers:
+        _submit(scraper_name, scraper_name, scraper.scrape, **scrape_kwargs)
+
+    # SCRAPER_TIMEOUT_S caps each running task (enforced in the collection
+    # loop below); tasks also queue behind SCRAPER_MAX_WORKERS busy threads,
+    # so a queue-scaled overall deadline backstops the whole phase in case
+    # hung tasks pile up on every worker
+    overall_timeout = SCRAPER_TIMEOUT_S * max(
+        1, -(-len(scrape_futures) // SCRAPER_MAX_WORKERS)
+    )
+    overall_deadline = time.monotonic() + overall_timeout
 
-    # Gated sources (disabled by default)
-    if gated_scrapers:
-        print("9. Scraping gated sources (enabled)...")
-        print("-" * 60)
-        for scraper in gated_scrapers:
+    sys.stdout.write(
+        f"Scraping {len(scrape_futures)} tasks across all sources concurrently...\n{SEP}\n"
+    )
+    pending = set(scrape_futures)
+    abandoned = []
+    while pending:
+        now = time.monotonic()
+        if now >= overall_deadline:
+            break
+        # Wake when the overall deadline hits or when the longest-running
+        # task crosses its per-task cap, whichever comes first
+        wake_at = min(
+            [overall_deadline]
+            + [cell[0] + SCRAPER_TIMEOUT_S
+               for f in pending if (cell := task_starts[f])]
+        )
+        done, _ = wait(pending, timeout=max(0.0, wake_at - now))
+        for future in done:
+            pending.discard(future)
+            stat_name, label = scrape_futures[future]
             try:
-                jobs = scraper.scrape(max_results=50)
-                all_jobs.extend(jobs)
-                scraper_name = scraper.__class__.__name__
-                scraper_stats[scraper_name] = len(jobs)
-                print(f"   Found {len(jobs)} jobs from {scraper_name}")
+                jobs = future.result()
+                scraper_stats[stat_name] += len(jobs)
+                total_scraped += len(jobs)
+                _collect(jobs)
+                logger.info(f"{label}: Found {len(jobs)} jobs")
             except Exception as e:
-                logger.error(f"Error scraping {scraper.__class__.__name__}: {e}")
-                scraper_stats[scraper.__class__.__name__] = 0
-                print(f"   Error: {e}")
-        print()
-    
-    print("=" * 60)
-    print(f"Total jobs scraped from all sources: {len(all_jobs)}")
-    print("=" * 60)
+                logger.error(f"Error scraping {label}: {e}")
+        # A running thread cannot be killed, but collection stops waiting
+        # for any task that has exceeded its cap; its worker thread is left
+        # behind and the pool is shut down without joining it below
+        now = time.monotonic()
+        for future in list(pending):
+            cell = task_starts[future]
+            if cell and now - cell[0] >= SCRAPER_TIMEOUT_S:
+                pending.discard(future)
+                abandoned.append(scrape_futures[future][1])
+    for label in abandoned:
+        logger.warning(
+            f"{label}: exceeded {SCRAPER_TIMEOUT_S}s per-task cap; abandoned"
+        )
+    if pending:
+        for f in pending:
+            f.cancel()
+        logger.warning(
+            f"Scraping timed out after {overall_timeout}s; "
+            f"skipped {len(pending)} remaining scraper tasks"
+        )
+
+    for stat_name, count in scraper_stats.items():
+        print(f"   Found {count} jobs from {stat_name}")
     print()
+
+    # Don't wait for any timed-out tasks still occupying worker threads
+    executor.shutdown(wait=False)
+
+    sys.stdout.write(f"{HDR}\nTotal jobs scraped from all sources: {total_scraped}\n{HDR}\n\n")
     
-    # Display diagnostics: jobs per scraper BEFORE filtering
-    print("DIAGNOSTICS - Jobs found per scraper (BEFORE filtering):")
-    print("-" * 60)
-    for scraper_name, count in sorted(scraper_stats.items(), key=lambda x: x[1], reverse=True):
-        print(f"  {scraper_name:30s}: {count:4d} jobs")
-    print("-" * 60)
-    print()
+    # Display diagnostics: jobs per scraper BEFORE filtering.
+    # Join into one buffer so the section costs a single stdout write instead
+    # of one syscall per line (matters when stdout is piped to a log file).
+    if VERBOSE:
+        lines = [
+            "DIAGNOSTICS - Jobs found per scraper (BEFORE filtering):",
+            "-" * 60,
+        ]
+        for scraper_name, count in sorted(scraper_stats.items(), key=itemgetter(1), reverse=True):
+            lines.append(f"  {scraper_name:30s}: {count:4d} jobs")
+        lines.append("-" * 60)
+        sys.stdout.write('\n'.join(lines) + '\n\n')
     
-    if not all_jobs:
+    if total_scraped == 0:
         print("No jobs found. This could be due to:")
         print("- Network connectivity issues")
         print("- Company career pages may have changed structure")
         print("- All companies may be temporarily unavailable")
         return
-    
-    # Filter jobs
-    print("Filtering jobs (India/Remote, Tech roles, 0-3 years experience)...")
-    print("-" * 60)
-    try:
-        filtered_jobs = job_filter.filter_jobs(all_jobs)
-    except Exception as e:
-        logger.error(f"Error filtering jobs: {e}")
-        print(f"Error: Filtering failed: {e}")
-        return
-    
-    print(f"Jobs after filtering: {len(filtered_jobs)} (removed {len(all_jobs) - len(filtered_jobs)})")
+
+    # Filtering (India/Remote, tech roles, 0-3 years) already happened batch
+    # by batch in _collect as each scraper finished
+    filtered_count = sum(map(len, filtered_parts))
+    sys.stdout.write(
+        f"Filtering jobs (India/Remote, Tech roles, 0-3 years experience)...\n{SEP}\n"
+        f"Jobs after filtering: {filtered_count} "
+        f"(removed {total_scraped - filtered_count} as duplicates or by filters)\n"
+    )
     
     # Track which scrapers' jobs passed filtering
-    filtered_stats = {}
-    for job in filtered_jobs:
-        source = job.get('source', 'Unknown')
-        filtered_stats[source] = filtered_stats.get(source, 0) + 1
-    
-    print()
-    print("DIAGNOSTICS - Jobs per source AFTER filtering:")
-    print("-" * 60)
-    for source, count in sorted(filtered_stats.items(), key=lambda x: x[1], reverse=True):
-        before = scraper_stats.get(source, 0)
-        if before > 0:
-            pct = (count / before) * 100
-            print(f"  {source:30s}: {count:4d} jobs ({pct:5.1f}% of {before} scraped)")
-        else:
-            print(f"  {source:30s}: {count:4d} jobs")
-    print("-" * 60)
-    print()
+    if VERBOSE:
+        # Counter's C-level counting beats a Python dict.get loop per job
+        filtered_stats = Counter(
+            job.get('source', 'Unknown') for job in chain.from_iterable(filtered_parts)
+        )
+
+        lines = [
+            "",
+            "DIAGNOSTICS - Jobs per source AFTER filtering:",
+            "-" * 60,
+        ]
+        for source, count in filtered_stats.most_common():
+            before = scraper_stats.get(source, 0)
+            if before > 0:
+                pct = (count / before) * 100
+                lines.append(f"  {source:30s}: {count:4d} jobs ({pct:5.1f}% of {before} scraped)")
+            else:
+                lines.append(f"  {source:30s}: {count:4d} jobs")
+        lines.append("-" * 60)
+        sys.stdout.write('\n'.join(lines) + '\n\n')
     
-    if not filtered_jobs:
+    if filtered_count == 0:
         print("No jobs matched the filter criteria.")
         print("Try adjusting search terms or location filters in utils/config.py")
         return
-    
-    # Remove duplicates based on URL
-    print("Removing duplicates...")
-    unique_jobs = []
-    seen_urls = set(existing_urls)  # Start with existing URLs
-    
-    for job in filtered_jobs:
-        if not job or not isinstance(job, dict):
-            continue
-        job_url = str(job.get('url', '') or '').strip()
-        if job_url and job_url not in seen_urls:
-            seen_urls.add(job_url)
-            unique_jobs.append(job)
-    
+
+    # Convert to slot-based records at the aggregation boundary; attribute
+    # access is cheaper than dict.get() chains in the scoring loops. URL
+    # duplicates were already dropped in _collect as each batch landed.
+    unique_jobs = [
+        JobRecord.from_dict(job)
+        for job in chain.from_iterable(filtered_parts)
+        if job and isinstance(job, dict)
+    ]
+
     new_jobs_count = len(unique_jobs)
     print(f"New unique jobs: {new_jobs_count}")
     print()
@@ -399,55 +421,64 @@ def main():
     # Score and sort jobs by priority
     print("Scoring and prioritizing jobs...")
     print("-" * 60)
-    scored_jobs = []
-    for job in unique_jobs:
-        try:
-            score_data = job_scorer.calculate_score(job)
-            job['priority_score'] = score_data['score']
-            job['days_since_posted'] = score_data['days_since_posted']
-            job['freshness'] = score_data['freshness']
-            job['salary'] = score_data['salary']
-            job['deadline'] = score_data['deadline']
-            job['days_until_deadline'] = score_data['days_until_deadline']
-            job['skills_match_pct'] = score_data['skills_match_pct']
-            scored_jobs.append(job)
-        except Exception as e:
-            logger.warning(f"Error scoring job {job.get('title', 'Unknown')}: {e}")
-            # Add job with default scores if scoring fails
-            job['priority_score'] = 0
-            job['days_since_posted'] = None
-            job['freshness'] = 'Unknown'
-            job['salary'] = None
-            job['deadline'] = None
-            job['days_until_deadline'] = None
-            job['skills_match_pct'] = 0
-            scored_jobs.append(job)
-    
-    # Sort by priority score (descending), then days since posted (ascending - fresher first)
-    scored_jobs.sort(key=lambda x: (
-        -x.get('priority_score', 0),  # Higher score first
-        x.get('days_since_posted', 999) if x.get('days_since_posted') is not None else 999  # Fresher first
+    if len(unique_jobs) >= PROCESS_POOL_MIN_JOBS:
+        scored_jobs = _map_in_processes(_score_chunk, unique_jobs)
+    else:
+        scored_jobs = []
+        for record in unique_jobs:
+            try:
+                job_scorer.score_record(record)
+            except Exception as e:
+                logger.warning(f"Error scoring job {record.title or 'Unknown'}: {e}")
+                # Keep the record with default scores if scoring fails
+                record.priority_score = 0
+                record.days_since_posted = None
+                record.freshness = 'Unknown'
+                record.salary = None
+                record.deadline = None
+                record.days_until_deadline = None
+                record.skills_match_pct = 0
+            scored_jobs.append(record)
+
+    # Show top 10 jobs by score; nlargest is O(N log 10) so the display
+    # doesn't depend on the full sort below
+    display_top = heapq.nlargest(10, scored_jobs, key=lambda r: (
+        r.priority_score,  # Higher score first
+        -(r.days_since_posted if r.days_since_posted is not None else 999)  # Fresher first
     ))
+    lines = ["Top 10 highest priority jobs:"]
+    for idx, record in enumerate(display_top, 1):
+        title = (record.title or 'Unknown')[:50]
+        company = (record.company or 'Unknown')[:30]
+        days = record.days_since_posted if record.days_since_posted is not None else 'N/A'
+        lines.append(f"  {idx:2d}. Score: {record.priority_score:3d} | {company:30s} | {title:50s} | Posted: {days} days ago")
+    sys.stdout.write('\n'.join(lines) + '\n\n')
     
-    # Show top 10 jobs by score
-    print(f"Top 10 highest priority jobs:")
-    for idx, job in enumerate(scored_jobs[:10], 1):
-        score = job.get('priority_score', 0)
-        title = job.get('title', 'Unknown')[:50]
-        company = job.get('company', 'Unknown')[:30]
-        days = job.get('days_since_posted', 'N/A')
-        print(f"  {idx:2d}. Score: {score:3d} | {company:30s} | {title:50s} | Posted: {days} days ago")
-    print()
-    
+    # The CSV consumer does want priority order, so sort the full list only
+    # here, right before the write
+    scored_jobs.sort(key=lambda r: (
+        -r.priority_score,  # Higher score first
+        r.days_since_posted if r.days_since_posted is not None else 999  # Fresher first
+    ))
+
     # Write to CSV (main aggregate file)
     print(f"Writing {new_jobs_count} jobs to CSV (sorted by priority)...")
     timestamped_file = None
+    scored_dicts = [record.to_dict() for record in scored_jobs]
     try:
-        csv_writer.write_jobs(scored_jobs, mode='a' if existing_urls else 'w')
+        # Serialize the rows once; the aggregate file and the snapshot get
+        # the identical buffer
+        csv_data = csv_writer.serialize(scored_dicts)
+        csv_writer.write_serialized(csv_data, mode='a' if had_existing_jobs else 'w')
+        # Keep the URL sidecar cache in step with the rows just written
+        csv_writer.update_url_cache(
+            (job['url'] for job in scored_dicts),
+            mode='a' if had_existing_jobs else 'w',
+        )
 
         # Also write a per-run timestamped CSV snapshot into a history folder
         try:
-            timestamped_file = csv_writer.write_timestamped_jobs(scored_jobs, CSV_HISTORY_DIR)
+            timestamped_file = csv_writer.write_timestamped_serialized(csv_data, CSV_HISTORY_DIR)
         except Exception as e:
             logger.warning(f"Error writing timestamped CSV snapshot: {e}")
     except Exception as e:
@@ -455,20 +486,21 @@ def main():
         print(f"Error: Failed to write to CSV: {e}")
         return
     
-    print()
-    print("=" * 60)
-    print("Scraping completed successfully!")
-    print(f"Total new jobs added: {new_jobs_count}")
-    print(f"CSV file: {csv_writer.output_file}")
-    if timestamped_file:
-        print(f"Timestamped CSV snapshot: {timestamped_file}")
-    print("=" * 60)
-    print()
-    print("Open the CSV file in Excel or Google Sheets to view jobs.")
-    print("Click on the 'Job URL' column to apply directly!")
+    snapshot_line = f"Timestamped CSV snapshot: {timestamped_file}\n" if timestamped_file else ""
+    sys.stdout.write(
+        f"\n{HDR}\n"
+        "Scraping completed successfully!\n"
+        f"Total new jobs added: {new_jobs_count}\n"
+        f"CSV file: {csv_writer.output_file}\n"
+        f"{snapshot_line}"
+        f"{HDR}\n\n"
+        "Open the CSV file in Excel or Google Sheets to view jobs.\n"
+        "Click on the 'Job URL' column to apply directly!\n"
+    )
 
 
 if __name__ == "__main__":
+    _configure_logging()
     try:
         main()
     except KeyboardInterrupt:
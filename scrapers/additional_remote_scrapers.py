@@ -8,15 +8,131 @@ SkipTheDrive, Growmotely, Remotewx, Pangian.
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urlencode
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib.parse import urlencode, urljoin
 
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, HTML_PARSER, iter_rss_items
 from utils.config import SEARCH_TERMS
 
 logger = logging.getLogger(__name__)
 
+# Class-attribute patterns for job-card discovery, compiled once at import.
+# Every scrape() call used to rebuild the same three regexes (and bs4 then
+# matches them against each element's class list), which is the tightest
+# loop in this module.
+_CARD_CLASS_RE = re.compile(r"job|listing", re.I)
+_CARD_CLASS_WIDE_RE = re.compile(r"job|listing|card", re.I)
+_TITLE_CLASS_RE = re.compile(r"title", re.I)
+_TITLE_CLASS_WIDE_RE = re.compile(r"title|name", re.I)
+_COMPANY_CLASS_RE = re.compile(r"company", re.I)
+
+# Parse filter shared by every full-page card scrape: only elements that can
+# be (or sit inside) a job card are built into the tree, so the parser skips
+# nav/footer/script subtrees entirely.
+_CARD_STRAINER = SoupStrainer(["div", "article", "li"], class_=_CARD_CLASS_WIDE_RE)
+
+
+def _clean_description(description: str) -> str:
+    """Strip HTML markup from an RSS item description.
+
+    Spinning up a parser per feed item is the expensive part, so markup-free
+    descriptions (common in these feeds) bypass it entirely.
+    """
+    if not description:
+        return ""
+    if "<" not in description:
+        return description
+    return BeautifulSoup(description, HTML_PARSER).get_text(" ", strip=True)
+
+
+class CardListScraper(BaseScraper):
+    """Shared scrape loop for boards that render a flat list of job cards.
+
+    Most of the HTML boards in this module differ only in their listing
+    path, card/title class patterns and source label, so the fetch -> soup
+    -> card loop lives here once and subclasses declare those knobs as
+    class attributes. One copy also means parse-level optimizations (the
+    strainer, byte-fed soups, compiled patterns) apply to every board.
+    """
+
+    source = ""
+    jobs_path = "/jobs"
+    card_tags = ("div", "article")
+    card_class_re = _CARD_CLASS_RE
+    title_class_re = _TITLE_CLASS_RE
+    # Some boards render the title itself as the job link
+    link_via_title = False
+    # Boards whose cards carry no company element skip that lookup
+    include_company = True
+
+    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
+        return self._scrape_card_list(max_results)
+
+    def _scrape_card_list(self, max_results: int) -> List[Dict]:
+        jobs: List[Dict] = []
+        # Local bindings skip the per-card attribute lookups in the loop
+        base_url = self.base_url
+        source = self.source
+        title_class_re = self.title_class_re
+        link_via_title = self.link_via_title
+        include_company = self.include_company
+        try:
+            resp = self.get(base_url + self.jobs_path)
+            if not resp:
+                return jobs
+
+            soup = BeautifulSoup(resp.content, HTML_PARSER, parse_only=_CARD_STRAINER)
+            # limit= stops the tree walk at the cap instead of collecting
+            # every match and slicing afterwards
+            job_cards = soup.find_all(list(self.card_tags), class_=self.card_class_re,
+                                      limit=max_results)
+
+            for card in job_cards:
+                try:
+                    title_elem = card.find(["h2", "h3", "a"], class_=title_class_re)
+                    if not title_elem:
+                        continue
+
+                    title = title_elem.get_text(strip=True)
+                    if not title:
+                        continue
+
+                    link = card.find("a", href=True)
+                    if not link and link_via_title and title_elem.name == "a":
+                        link = title_elem
+                    url = link["href"] if link and link.get("href") else ""
+                    # Tuple startswith is exact about the scheme (plain
+                    # "http" also matched e.g. "httpfoo://"), and urljoin
+                    # resolves host-relative hrefs bare concatenation broke
+                    if url and not url.startswith(("http://", "https://")):
+                        url = urljoin(base_url, url)
+
+                    company = ""
+                    if include_company:
+                        company_elem = card.find(["div", "span"], class_=_COMPANY_CLASS_RE)
+                        company = company_elem.get_text(strip=True) if company_elem else ""
+
+                    jobs.append({
+                        "title": title,
+                        "company": company,
+                        "location": "Remote",
+                        "url": url or base_url,
+                        "experience": "",
+                        "description": "",
+                        "posted_date": "",
+                        "source": source,
+                    })
+                except Exception as e:
+                    logger.debug("%s: Error parsing card: %s", source, e)
+                    continue
+        except Exception as e:
+            logger.warning("%s: Error scraping: %s", source, e)
+
+        return jobs
+
 
 class OttaScraper(BaseScraper):
     """Scraper for Otta (startup jobs, many remote)."""
@@ -31,21 +147,33 @@ class OttaScraper(BaseScraper):
 
         jobs: List[Dict] = []
         # Otta uses search API - try to scrape search results
-        for keyword in keywords[:3]:  # Limit to avoid too many requests
+        search_keywords = keywords[:3]  # Limit to avoid too many requests
+
+        if not search_keywords:
+            return jobs
+
+        def _fetch(keyword):
+            search_url = f"{self.base_url}/jobs?q={keyword.replace(' ', '+')}"
+            return self.get(search_url)
+
+        # The keyword searches are independent GETs, so fetch them in
+        # parallel and parse the responses on this thread
+        with ThreadPoolExecutor(max_workers=len(search_keywords)) as pool:
+            responses = list(pool.map(_fetch, search_keywords))
+
+        for keyword, resp in zip(search_keywords, responses):
             try:
-                # Try search page
-                search_url = f"{self.base_url}/jobs?q={keyword.replace(' ', '+')}"
-                resp = self.get(search_url)
                 if not resp:
                     continue
 
-                soup = BeautifulSoup(resp.text, "html.parser")
+                soup = BeautifulSoup(resp.content, HTML_PARSER, parse_only=_CARD_STRAINER)
                 # Otta structure may vary - try common patterns
-                job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|card|listing", re.I))
+                job_cards = soup.find_all(["div", "article"], class_=_CARD_CLASS_WIDE_RE,
+                                          limit=max_results)
 
-                for card in job_cards[:max_results]:
+                for card in job_cards:
                     try:
-                        title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title|name", re.I))
+                        title_elem = card.find(["h2", "h3", "a"], class_=_TITLE_CLASS_WIDE_RE)
                         if not title_elem:
                             continue
 
@@ -55,10 +183,10 @@ class OttaScraper(BaseScraper):
 
                         link = card.find("a", href=True)
                         url = link["href"] if link else ""
-                        if url and not url.startswith("http"):
-                            url = self.base_url + url
+                        if url and not url.startswith(("http://", "https://")):
+                            url = urljoin(self.base_url, url)
 
-                        company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
+                        company_elem = card.find(["div", "span"], class_=_COMPANY_CLASS_RE)
                         company = company_elem.get_text(strip=True) if company_elem else ""
 
                         jobs.append({
@@ -75,10 +203,10 @@ class OttaScraper(BaseScraper):
                         if len(jobs) >= max_results:
                             break
                     except Exception as e:
-                        logger.debug(f"Otta: Error parsing job card: {e}")
+                        logger.debug("Otta: Error parsing job card: %s", e)
                         continue
             except Exception as e:
-                logger.warning(f"Otta: Error searching '{keyword}': {e}")
+                logger.warning("Otta: Error searching '%s': %s", keyword, e)
                 continue
 
         return jobs
@@ -97,24 +225,21 @@ class JobspressoScraper(BaseScraper):
             # Try RSS feed first
             rss_url = f"{self.base_url}/feed/"
             resp = self.get(rss_url, headers={"Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8"})
-            if resp and resp.text:
-                soup = BeautifulSoup(resp.text, "xml")
-                items = soup.find_all("item")
-
-                for item in items[:max_results]:
+            if resp and resp.content:
+                for item in islice(iter_rss_items(resp.content), max_results):
                     try:
                         title = (item.findtext("title") or "").strip()
                         url = (item.findtext("link") or "").strip()
                         description = (item.findtext("description") or "").strip()
                         posted = (item.findtext("pubDate") or "").strip()
 
-                        # Extract company from title if format is "Job Title at Company"
+                        # Extract company from title if format is "Job Title at Company";
+                        # one find() scan plus slicing, no list allocation
                         company = ""
-                        if " at " in title:
-                            parts = title.split(" at ", 1)
-                            if len(parts) == 2:
-                                title = parts[0].strip()
-                                company = parts[1].strip()
+                        sep = title.find(" at ")
+                        if sep != -1:
+                            company = title[sep + 4:].strip()
+                            title = title[:sep].strip()
 
                         jobs.append({
                             "title": title,
@@ -122,74 +247,31 @@ class JobspressoScraper(BaseScraper):
                             "location": "Remote",
                             "url": url,
                             "experience": "",
-                            "description": BeautifulSoup(description, "html.parser").get_text(" ", strip=True),
+                            "description": _clean_description(description),
                             "posted_date": posted,
                             "source": "Jobspresso",
                         })
                     except Exception as e:
-                        logger.debug(f"Jobspresso: Error parsing item: {e}")
+                        logger.debug("Jobspresso: Error parsing item: %s", e)
                         continue
         except Exception as e:
-            logger.warning(f"Jobspresso: Error scraping: {e}")
+            logger.warning("Jobspresso: Error scraping: %s", e)
 
         return jobs
 
 
-class DynamiteJobsScraper(BaseScraper):
+class DynamiteJobsScraper(CardListScraper):
     """Scraper for Dynamite Jobs."""
 
+    source = "DynamiteJobs"
+    jobs_path = "/remote-jobs"
+    card_class_re = _CARD_CLASS_WIDE_RE
+    link_via_title = True
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://dynamitejobs.com"
 
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            # Try jobs listing page
-            jobs_url = f"{self.base_url}/remote-jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing|card", re.I))
-
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
-
-                    link = card.find("a", href=True) or title_elem if title_elem.name == "a" else None
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
-
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "DynamiteJobs",
-                    })
-                except Exception as e:
-                    logger.debug(f"DynamiteJobs: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"DynamiteJobs: Error scraping: {e}")
-
-        return jobs
-
 
 class WorkingNomadsScraper(BaseScraper):
     """Scraper for Working Nomads."""
@@ -204,11 +286,8 @@ class WorkingNomadsScraper(BaseScraper):
             # Try RSS feed
             rss_url = f"{self.base_url}/jobs.rss"
             resp = self.get(rss_url, headers={"Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8"})
-            if resp and resp.text:
-                soup = BeautifulSoup(resp.text, "xml")
-                items = soup.find_all("item")
-
-                for item in items[:max_results]:
+            if resp and resp.content:
+                for item in islice(iter_rss_items(resp.content), max_results):
                     try:
                         title = (item.findtext("title") or "").strip()
                         url = (item.findtext("link") or "").strip()
@@ -221,705 +300,188 @@ class WorkingNomadsScraper(BaseScraper):
                             "location": "Remote",
                             "url": url,
                             "experience": "",
-                            "description": BeautifulSoup(description, "html.parser").get_text(" ", strip=True),
+                            "description": _clean_description(description),
                             "posted_date": posted,
                             "source": "WorkingNomads",
                         })
                     except Exception as e:
-                        logger.debug(f"WorkingNomads: Error parsing item: {e}")
+                        logger.debug("WorkingNomads: Error parsing item: %s", e)
                         continue
         except Exception as e:
-            logger.warning(f"WorkingNomads: Error scraping: {e}")
+            logger.warning("WorkingNomads: Error scraping: %s", e)
 
         return jobs
 
 
-class RemoteSourceScraper(BaseScraper):
+class RemoteSourceScraper(CardListScraper):
     """Scraper for RemoteSource."""
 
+    source = "RemoteSource"
+    card_tags = ("div", "article", "li")
+    link_via_title = True
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://remotesource.io"
 
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
 
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article", "li"], class_=re.compile(r"job|listing", re.I))
+class NoVisaJobsScraper(CardListScraper):
+    """Scraper for No Visa Jobs."""
 
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
+    source = "NoVisaJobs"
 
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
+    def __init__(self):
+        super().__init__()
+        self.base_url = "https://novisajobs.com"
 
-                    link = card.find("a", href=True) or (title_elem if title_elem.name == "a" else None)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
 
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
+class WorldTeamsScraper(CardListScraper):
+    """Scraper for World Teams."""
 
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "RemoteSource",
-                    })
-                except Exception as e:
-                    logger.debug(f"RemoteSource: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"RemoteSource: Error scraping: {e}")
+    source = "WorldTeams"
 
-        return jobs
+    def __init__(self):
+        super().__init__()
+        self.base_url = "https://worldteams.io"
 
 
-class NoVisaJobsScraper(BaseScraper):
-    """Scraper for No Visa Jobs."""
+class RemoteRebellionScraper(CardListScraper):
+    """Scraper for Remote Rebellion."""
+
+    source = "RemoteRebellion"
 
     def __init__(self):
         super().__init__()
-        self.base_url = "https://novisajobs.com"
+        self.base_url = "https://remoterebellion.com"
 
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
 
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing", re.I))
+class YCombinatorJobsScraper(CardListScraper):
+    """Scraper for Y Combinator Jobs (startup jobs, many remote)."""
 
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
+    source = "YCombinatorJobs"
+    card_class_re = _CARD_CLASS_WIDE_RE
+    title_class_re = _TITLE_CLASS_WIDE_RE
+    link_via_title = True
 
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
+    def __init__(self):
+        super().__init__()
+        self.base_url = "https://www.workatastartup.com"
 
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
 
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
+class FlexaScraper(CardListScraper):
+    """Scraper for Flexa (flexible/remote jobs)."""
 
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "NoVisaJobs",
-                    })
-                except Exception as e:
-                    logger.debug(f"NoVisaJobs: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"NoVisaJobs: Error scraping: {e}")
+    source = "Flexa"
 
-        return jobs
+    def __init__(self):
+        super().__init__()
+        self.base_url = "https://flexa.careers"
 
 
-class WorldTeamsScraper(BaseScraper):
-    """Scraper for World Teams."""
+class RemoteCoScraper(CardListScraper):
+    """Scraper for Remote.co."""
+
+    source = "Remote.co"
+    jobs_path = "/remote-jobs"
+    include_company = False
 
     def __init__(self):
         super().__init__()
-        self.base_url = "https://worldteams.io"
+        self.base_url = "https://remote.co"
 
     def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
         jobs: List[Dict] = []
         try:
-            jobs_url = f"{self.base_url}/jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing", re.I))
-
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
+            # Try RSS feed first
+            rss_url = f"{self.base_url}/remote-jobs/feed/"
+            resp = self.get(rss_url, headers={"Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8"})
+            if resp and resp.content:
+                for item in islice(iter_rss_items(resp.content), max_results):
+                    try:
+                        title = (item.findtext("title") or "").strip()
+                        url = (item.findtext("link") or "").strip()
+                        description = (item.findtext("description") or "").strip()
+                        posted = (item.findtext("pubDate") or "").strip()
 
-                    title = title_elem.get_text(strip=True)
-                    if not title:
+                        jobs.append({
+                            "title": title,
+                            "company": "",
+                            "location": "Remote",
+                            "url": url,
+                            "experience": "",
+                            "description": _clean_description(description),
+                            "posted_date": posted,
+                            "source": "Remote.co",
+                        })
+                    except Exception as e:
+                        logger.debug("Remote.co: Error parsing item: %s", e)
                         continue
-
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
-
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "WorldTeams",
-                    })
-                except Exception as e:
-                    logger.debug(f"WorldTeams: Error parsing card: {e}")
-                    continue
+            else:
+                # Fallback to HTML scraping via the shared card loop
+                jobs = self._scrape_card_list(max_results)
         except Exception as e:
-            logger.warning(f"WorldTeams: Error scraping: {e}")
+            logger.warning("Remote.co: Error scraping: %s", e)
 
         return jobs
 
 
-class RemoteRebellionScraper(BaseScraper):
-    """Scraper for Remote Rebellion."""
+class DailyRemoteScraper(CardListScraper):
+    """Scraper for DailyRemote."""
+
+    source = "DailyRemote"
+    jobs_path = "/remote-jobs"
+    card_class_re = _CARD_CLASS_WIDE_RE
 
     def __init__(self):
         super().__init__()
-        self.base_url = "https://remoterebellion.com"
+        self.base_url = "https://dailyremote.com"
 
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
 
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing", re.I))
+class RemoteIoScraper(CardListScraper):
+    """Scraper for remote.io."""
 
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
+    source = "remote.io"
 
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
+    def __init__(self):
+        super().__init__()
+        self.base_url = "https://remote.io"
 
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
 
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
+class RemoteHubScraper(CardListScraper):
+    """Scraper for RemoteHub."""
 
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "RemoteRebellion",
-                    })
-                except Exception as e:
-                    logger.debug(f"RemoteRebellion: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"RemoteRebellion: Error scraping: {e}")
+    source = "RemoteHub"
+    jobs_path = "/remote-jobs"
 
-        return jobs
+    def __init__(self):
+        super().__init__()
+        self.base_url = "https://remotehub.com"
 
 
-class YCombinatorJobsScraper(BaseScraper):
-    """Scraper for Y Combinator Jobs (startup jobs, many remote)."""
+class RemotersMeScraper(CardListScraper):
+    """Scraper for Remoters.me."""
+
+    source = "Remoters.me"
 
     def __init__(self):
         super().__init__()
-        self.base_url = "https://www.workatastartup.com"
+        self.base_url = "https://remoters.me"
 
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
 
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing|card", re.I))
+class JustRemoteScraper(CardListScraper):
+    """Scraper for JustRemote."""
 
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title|name", re.I))
-                    if not title_elem:
-                        continue
+    source = "JustRemote"
+    jobs_path = "/remote-jobs"
+    card_class_re = _CARD_CLASS_WIDE_RE
 
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
+    def __init__(self):
+        super().__init__()
+        self.base_url = "https://justremote.co"
 
-                    link = card.find("a", href=True) or (title_elem if title_elem.name == "a" else None)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
 
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "YCombinatorJobs",
-                    })
-                except Exception as e:
-                    logger.debug(f"YCombinatorJobs: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"YCombinatorJobs: Error scraping: {e}")
-
-        return jobs
-
-
-class FlexaScraper(BaseScraper):
-    """Scraper for Flexa (flexible/remote jobs)."""
-
-    def __init__(self):
-        super().__init__()
-        self.base_url = "https://flexa.careers"
-
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing", re.I))
-
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
-
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
-
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "Flexa",
-                    })
-                except Exception as e:
-                    logger.debug(f"Flexa: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"Flexa: Error scraping: {e}")
-
-        return jobs
-
-
-class RemoteCoScraper(BaseScraper):
-    """Scraper for Remote.co."""
-
-    def __init__(self):
-        super().__init__()
-        self.base_url = "https://remote.co"
-
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            # Try RSS feed
-            rss_url = f"{self.base_url}/remote-jobs/feed/"
-            resp = self.get(rss_url, headers={"Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8"})
-            if resp and resp.text:
-                soup = BeautifulSoup(resp.text, "xml")
-                items = soup.find_all("item")
-
-                for item in items[:max_results]:
-                    try:
-                        title = (item.findtext("title") or "").strip()
-                        url = (item.findtext("link") or "").strip()
-                        description = (item.findtext("description") or "").strip()
-                        posted = (item.findtext("pubDate") or "").strip()
-
-                        jobs.append({
-                            "title": title,
-                            "company": "",
-                            "location": "Remote",
-                            "url": url,
-                            "experience": "",
-                            "description": BeautifulSoup(description, "html.parser").get_text(" ", strip=True),
-                            "posted_date": posted,
-                            "source": "Remote.co",
-                        })
-                    except Exception as e:
-                        logger.debug(f"Remote.co: Error parsing item: {e}")
-                        continue
-            else:
-                # Fallback to HTML scraping
-                jobs_url = f"{self.base_url}/remote-jobs"
-                resp = self.get(jobs_url)
-                if resp:
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing", re.I))
-
-                    for card in job_cards[:max_results]:
-                        try:
-                            title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                            if not title_elem:
-                                continue
-
-                            title = title_elem.get_text(strip=True)
-                            if not title:
-                                continue
-
-                            link = card.find("a", href=True)
-                            url = link["href"] if link and link.get("href") else ""
-                            if url and not url.startswith("http"):
-                                url = self.base_url + url
-
-                            jobs.append({
-                                "title": title,
-                                "company": "",
-                                "location": "Remote",
-                                "url": url or self.base_url,
-                                "experience": "",
-                                "description": "",
-                                "posted_date": "",
-                                "source": "Remote.co",
-                            })
-                        except Exception as e:
-                            logger.debug(f"Remote.co: Error parsing card: {e}")
-                            continue
-        except Exception as e:
-            logger.warning(f"Remote.co: Error scraping: {e}")
-
-        return jobs
-
-
-class DailyRemoteScraper(BaseScraper):
-    """Scraper for DailyRemote."""
-
-    def __init__(self):
-        super().__init__()
-        self.base_url = "https://dailyremote.com"
-
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/remote-jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing|card", re.I))
-
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
-
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
-
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "DailyRemote",
-                    })
-                except Exception as e:
-                    logger.debug(f"DailyRemote: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"DailyRemote: Error scraping: {e}")
-
-        return jobs
-
-
-class RemoteIoScraper(BaseScraper):
-    """Scraper for remote.io."""
-
-    def __init__(self):
-        super().__init__()
-        self.base_url = "https://remote.io"
-
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing", re.I))
-
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
-
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
-
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "remote.io",
-                    })
-                except Exception as e:
-                    logger.debug(f"remote.io: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"remote.io: Error scraping: {e}")
-
-        return jobs
-
-
-class RemoteHubScraper(BaseScraper):
-    """Scraper for RemoteHub."""
-
-    def __init__(self):
-        super().__init__()
-        self.base_url = "https://remotehub.com"
-
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/remote-jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing", re.I))
-
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
-
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
-
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "RemoteHub",
-                    })
-                except Exception as e:
-                    logger.debug(f"RemoteHub: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"RemoteHub: Error scraping: {e}")
-
-        return jobs
-
-
-class RemotersMeScraper(BaseScraper):
-    """Scraper for Remoters.me."""
-
-    def __init__(self):
-        super().__init__()
-        self.base_url = "https://remoters.me"
-
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing", re.I))
-
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
-
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
-
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "Remoters.me",
-                    })
-                except Exception as e:
-                    logger.debug(f"Remoters.me: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"Remoters.me: Error scraping: {e}")
-
-        return jobs
-
-
-class JustRemoteScraper(BaseScraper):
-    """Scraper for JustRemote."""
-
-    def __init__(self):
-        super().__init__()
-        self.base_url = "https://justremote.co"
-
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/remote-jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing|card", re.I))
-
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
-
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
-
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "JustRemote",
-                    })
-                except Exception as e:
-                    logger.debug(f"JustRemote: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"JustRemote: Error scraping: {e}")
-
-        return jobs
-
-
-class SkipTheDriveScraper(BaseScraper):
-    """Scraper for SkipTheDrive."""
+class SkipTheDriveScraper(BaseScraper):
+    """Scraper for SkipTheDrive."""
 
     def __init__(self):
         super().__init__()
@@ -931,11 +493,8 @@ class SkipTheDriveScraper(BaseScraper):
             # Try RSS feed
             rss_url = f"{self.base_url}/feed/"
             resp = self.get(rss_url, headers={"Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8"})
-            if resp and resp.text:
-                soup = BeautifulSoup(resp.text, "xml")
-                items = soup.find_all("item")
-
-                for item in items[:max_results]:
+            if resp and resp.content:
+                for item in islice(iter_rss_items(resp.content), max_results):
                     try:
                         title = (item.findtext("title") or "").strip()
                         url = (item.findtext("link") or "").strip()
@@ -948,179 +507,45 @@ class SkipTheDriveScraper(BaseScraper):
                             "location": "Remote",
                             "url": url,
                             "experience": "",
-                            "description": BeautifulSoup(description, "html.parser").get_text(" ", strip=True),
+                            "description": _clean_description(description),
                             "posted_date": posted,
                             "source": "SkipTheDrive",
                         })
                     except Exception as e:
-                        logger.debug(f"SkipTheDrive: Error parsing item: {e}")
+                        logger.debug("SkipTheDrive: Error parsing item: %s", e)
                         continue
         except Exception as e:
-            logger.warning(f"SkipTheDrive: Error scraping: {e}")
+            logger.warning("SkipTheDrive: Error scraping: %s", e)
 
         return jobs
 
 
-class GrowmotelyScraper(BaseScraper):
+class GrowmotelyScraper(CardListScraper):
     """Scraper for Growmotely."""
 
+    source = "Growmotely"
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://growmotely.com"
 
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing", re.I))
-
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
-
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
-
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "Growmotely",
-                    })
-                except Exception as e:
-                    logger.debug(f"Growmotely: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"Growmotely: Error scraping: {e}")
-
-        return jobs
-
 
-class RemotewxScraper(BaseScraper):
+class RemotewxScraper(CardListScraper):
     """Scraper for Remotewx."""
 
+    source = "Remotewx"
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://remotewx.com"
 
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing", re.I))
-
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
-
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
-
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
 
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "Remotewx",
-                    })
-                except Exception as e:
-                    logger.debug(f"Remotewx: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"Remotewx: Error scraping: {e}")
-
-        return jobs
-
-
-class PangianScraper(BaseScraper):
+class PangianScraper(CardListScraper):
     """Scraper for Pangian."""
 
+    source = "Pangian"
+    jobs_path = "/remote-jobs"
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://pangian.com"
-
-    def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
-        jobs: List[Dict] = []
-        try:
-            jobs_url = f"{self.base_url}/remote-jobs"
-            resp = self.get(jobs_url)
-            if not resp:
-                return jobs
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.find_all(["div", "article"], class_=re.compile(r"job|listing", re.I))
-
-            for card in job_cards[:max_results]:
-                try:
-                    title_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"title", re.I))
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.get_text(strip=True)
-                    if not title:
-                        continue
-
-                    link = card.find("a", href=True)
-                    url = link["href"] if link and link.get("href") else ""
-                    if url and not url.startswith("http"):
-                        url = self.base_url + url
-
-                    company_elem = card.find(["div", "span"], class_=re.compile(r"company", re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else ""
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": "Remote",
-                        "url": url or self.base_url,
-                        "experience": "",
-                        "description": "",
-                        "posted_date": "",
-                        "source": "Pangian",
-                    })
-                except Exception as e:
-                    logger.debug(f"Pangian: Error parsing card: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"Pangian: Error scraping: {e}")
-
-        return jobs
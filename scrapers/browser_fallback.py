@@ -5,10 +5,13 @@ resulting HTML with BeautifulSoup using heuristics similar to _scrape_custom.
 """
 
 import logging
+import re
 from typing import List, Dict
 
+import soupsieve
 from bs4 import BeautifulSoup
 
+from scrapers.base_scraper import HTML_PARSER
 from utils.config import (
     SEARCH_TERMS,
     BROWSER_PAGE_LOAD_TIMEOUT,
@@ -16,6 +19,38 @@ from utils.config import (
 
 logger = logging.getLogger(__name__)
 
+# Class-attribute matchers, compiled once at import. bs4 runs Pattern
+# objects in C per class token, where the previous lambdas paid a Python
+# call plus a lower() allocation for every attribute of every candidate tag.
+_TITLE_CLASS_RE = re.compile(r"title|name|heading", re.I)
+_TITLE_ONLY_RE = re.compile(r"title", re.I)
+_LOCATION_CLASS_RE = re.compile(r"location|city|place", re.I)
+_LOCATION_ONLY_RE = re.compile(r"location", re.I)
+_DESC_CLASS_RE = re.compile(r"description|summary|details", re.I)
+
+# One comma-joined selector group means soupsieve walks the tree once and
+# returns unique elements in document order, instead of twelve full
+# traversals whose overlapping results needed a dedupe pass. Compiling at
+# import also skips the per-call selector parse.
+_JOB_SELECTOR = soupsieve.compile(
+    ", ".join(
+        [
+            'a[href*="job"]',
+            'a[href*="careers"]',
+            'a[href*="position"]',
+            "div.job",
+            "div.position",
+            "div.opening",
+            "li.job",
+            "li.position",
+            "article.job",
+            '[class*="job"]',
+            '[class*="career"]',
+            '[class*="opening"]',
+        ]
+    )
+)
+
 
 class BrowserCareerFallback:
     """Optional Selenium-based fallback for career pages that need JS."""
@@ -81,44 +116,22 @@ class BrowserCareerFallback:
         self, html: str, company_name: str, career_url: str, search_terms: List[str]
     ) -> List[Dict]:
         """Heuristic extraction of jobs from rendered HTML."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
         jobs: List[Dict] = []
 
-        job_selectors = [
-            'a[href*="job"]',
-            'a[href*="careers"]',
-            'a[href*="position"]',
-            "div.job",
-            "div.position",
-            "div.opening",
-            "li.job",
-            "li.position",
-            "article.job",
-            '[class*="job"]',
-            '[class*="career"]',
-            '[class*="opening"]',
-        ]
+        job_elements = _JOB_SELECTOR.select(soup)
 
-        job_elements = []
-        for selector in job_selectors:
-            job_elements.extend(soup.select(selector))
+        # Lower the terms once instead of per element
+        search_terms_lower = [term.lower() for term in search_terms]
 
-        seen_ids = set()
         for element in job_elements:
-            elem_id = id(element)
-            if elem_id in seen_ids:
-                continue
-            seen_ids.add(elem_id)
-
             # Title
             title_elem = (
                 element.find(
                     ["h1", "h2", "h3", "h4", "h5", "h6"],
-                    class_=lambda c: c and any(
-                        k in c.lower() for k in ("title", "name", "heading")
-                    ),
+                    class_=_TITLE_CLASS_RE,
                 )
-                or element.find("span", class_=lambda c: c and "title" in c.lower())
+                or element.find("span", class_=_TITLE_ONLY_RE)
                 or element.find("a")
                 or element
             )
@@ -127,7 +140,7 @@ class BrowserCareerFallback:
                 continue
 
             title_lower = title.lower()
-            if not any(term.lower() in title_lower for term in search_terms):
+            if not any(term in title_lower for term in search_terms_lower):
                 continue
 
             # URL
@@ -142,12 +155,11 @@ class BrowserCareerFallback:
             loc_elem = (
                 element.find(
                     ["span", "div", "p"],
-                    class_=lambda c: c
-                    and any(k in c.lower() for k in ("location", "city", "place")),
+                    class_=_LOCATION_CLASS_RE,
                 )
                 or element.parent.find(
                     ["span", "div"],
-                    class_=lambda c: c and "location" in c.lower(),
+                    class_=_LOCATION_ONLY_RE,
                 )
                 if element.parent
                 else None
@@ -157,8 +169,7 @@ class BrowserCareerFallback:
             # Description
             desc_elem = element.find(
                 ["p", "div"],
-                class_=lambda c: c
-                and any(k in c.lower() for k in ("description", "summary", "details")),
+                class_=_DESC_CLASS_RE,
             )
             description = desc_elem.get_text(strip=True) if desc_elem else ""
 
@@ -4,21 +4,84 @@ import json
 import os
 import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
-from scrapers.base_scraper import BaseScraper
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from scrapers.base_scraper import BaseScraper, HTML_PARSER
 from scrapers.browser_fallback import BrowserCareerFallback
 from utils.config import (
     SEARCH_TERMS,
     USE_BROWSER_FALLBACK,
     BROWSER_MAX_COMPANIES,
+    SCRAPER_MAX_WORKERS,
 )
 from utils.failure_reporter import FailureReporter
+from utils import json_io
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns used on every element of every career page, compiled once at
+# import instead of inside each find/find_all call.
+_JOB_CLASS_RE = re.compile(r'job|position|opening', re.I)
+_POSTING_CLASS_RE = re.compile(r'posting|job', re.I)
+_TITLE_CLASS_RE = re.compile(r'title|name', re.I)
+_TITLE_HEADING_CLASS_RE = re.compile(r'title|name|heading', re.I)
+_LOCATION_CLASS_RE = re.compile(r'location', re.I)
+_LOCATION_WIDE_CLASS_RE = re.compile(r'location|city|place', re.I)
+_DESC_CLASS_RE = re.compile(r'description|summary', re.I)
+_BOARD_TOKEN_RE = re.compile(r'boardToken["\']?\s*[:=]\s*["\']([^"\']+)["\']')
+_GH_API_BOARD_RE = re.compile(r'/api/v1/boards/([^/]+)')
+
+# Parse filters for the HTML fallback soups: only elements that can be
+# job cards (and their subtrees) make it into the tree, so the parser
+# skips the rest of the page instead of materializing it.
+_GH_JOB_STRAINER = SoupStrainer(['a', 'div'], class_=_JOB_CLASS_RE)
+_LEVER_JOB_STRAINER = SoupStrainer(['a', 'div'], class_=_POSTING_CLASS_RE)
+
+
+def _compile_search_terms(search_terms: List[str]) -> re.Pattern:
+    """Compile search terms into one case-insensitive alternation.
+
+    One C-level regex scan per title replaces a Python loop that lowered
+    every term for every job. Compiled once per company instead of being
+    re-evaluated per job.
+    """
+    if not search_terms:
+        # Match nothing, mirroring any() over an empty term list
+        return re.compile(r'(?!)')
+    return re.compile('|'.join(re.escape(str(term)) for term in search_terms), re.I)
+
+# One comma-joined selector group compiled at import: soupsieve walks the
+# tree once and yields unique elements in document order, replacing the
+# per-page loop of 21 select() passes plus an id()-based dedupe.
+_JOB_SELECTOR = soupsieve.compile(', '.join([
+    'a[href*="job"]',
+    'a[href*="career"]',
+    'a[href*="position"]',
+    'a[href*="opening"]',
+    'a[href*="role"]',
+    'div.job',
+    'div.position',
+    'div.opening',
+    'div.role',
+    'li.job',
+    'li.position',
+    'li.opening',
+    'article.job',
+    'article.position',
+    '[class*="job"]',
+    '[class*="position"]',
+    '[class*="opening"]',
+    '[class*="role"]',
+    '[class*="vacancy"]',
+    '[data-job-id]',
+    '[data-position-id]',
+]))
+
 
 class CompanyCareersScraper(BaseScraper):
     """Scraper for company career pages - most reliable source."""
@@ -45,6 +108,17 @@ class CompanyCareersScraper(BaseScraper):
         self.failure_reporter = FailureReporter()
         self.browser_fallback = BrowserCareerFallback(enabled=USE_BROWSER_FALLBACK)
         self._browser_companies_used = 0
+        # Companies scrape concurrently, but the single Selenium driver
+        # (and its usage budget) must be used by one thread at a time
+        self._browser_lock = threading.Lock()
+        # Greenhouse board tokens are stable per company, so remembering
+        # them across runs skips the career-page fetch and parse entirely
+        self._gh_token_cache_file = "data/.gh_board_tokens.json"
+        self._gh_token_cache = self._load_gh_token_cache()
+        self._gh_token_cache_dirty = False
+        # Index of each company's zero_jobs failure record, so the browser
+        # fallback can relabel it without scanning the whole failures list
+        self._zero_job_failures: Dict[str, Dict] = {}
     
     def _load_companies(self) -> Dict:
         """Load companies from JSON file."""
@@ -52,19 +126,40 @@ class CompanyCareersScraper(BaseScraper):
             if not os.path.exists(self.companies_file):
                 logger.error(f"Companies file not found: {self.companies_file}")
                 return {}
-            with open(self.companies_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if not isinstance(data, dict):
-                    logger.error("Companies file does not contain a valid dictionary")
-                    return {}
-                return data
-        except json.JSONDecodeError as e:
+            data = json_io.load_file(self.companies_file)
+            if not isinstance(data, dict):
+                logger.error("Companies file does not contain a valid dictionary")
+                return {}
+            return data
+        except (json.JSONDecodeError, ValueError) as e:
             logger.error(f"Error parsing companies JSON file: {e}")
             return {}
         except Exception as e:
             logger.error(f"Error loading companies file: {e}")
             return {}
     
+    def _load_gh_token_cache(self) -> Dict[str, str]:
+        """Load the persisted company -> Greenhouse board token map."""
+        try:
+            if not os.path.exists(self._gh_token_cache_file):
+                return {}
+            data = json_io.load_file(self._gh_token_cache_file)
+            if isinstance(data, dict):
+                return {str(k): str(v) for k, v in data.items()}
+        except Exception as e:
+            logger.warning(f"Could not load board token cache: {e}")
+        return {}
+
+    def _save_gh_token_cache(self):
+        """Persist discovered board tokens, if any changed this run."""
+        if not self._gh_token_cache_dirty:
+            return
+        try:
+            json_io.dump_file(self._gh_token_cache, self._gh_token_cache_file)
+            self._gh_token_cache_dirty = False
+        except Exception as e:
+            logger.warning(f"Could not save board token cache: {e}")
+    
     def _extract_text(self, element) -> str:
         """Extract text from BeautifulSoup element."""
         if element:
@@ -120,41 +215,47 @@ class CompanyCareersScraper(BaseScraper):
             List of job dictionaries
         """
         jobs = []
+        terms_re = _compile_search_terms(search_terms)
         
         try:
-            # Greenhouse API endpoint
-            # Try to find the board token from the page
-            response = self.get(career_url)
-            if not response:
-                return jobs
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Look for Greenhouse board token
-            script_tags = soup.find_all('script')
-            board_token = None
-            
-            for script in script_tags:
-                if script.string:
-                    # Look for board token in script
-                    match = re.search(r'boardToken["\']?\s*[:=]\s*["\']([^"\']+)["\']', script.string)
-                    if match:
-                        board_token = match.group(1)
-                        break
-            
+            # A cached token means the career page never has to be fetched:
+            # the run goes straight to the boards API below
+            board_token = self._gh_token_cache.get(company_name)
+            response = None
+
             if not board_token:
-                # Try alternative: look for data attributes or API calls
-                # Many Greenhouse sites use /api/v1/boards/{board}/jobs
-                # Try to extract from page structure
-                api_match = re.search(r'/api/v1/boards/([^/]+)', response.text)
-                if api_match:
-                    board_token = api_match.group(1)
-            
+                # Try to find the board token from the page. The token is a
+                # substring of the raw markup, so regex the response text
+                # directly rather than building a DOM to walk script tags.
+                response = self.get(career_url)
+                if not response:
+                    return jobs
+
+                match = _BOARD_TOKEN_RE.search(response.text)
+                if match:
+                    board_token = match.group(1)
+                else:
+                    # Try alternative: look for data attributes or API calls
+                    # Many Greenhouse sites use /api/v1/boards/{board}/jobs
+                    api_match = _GH_API_BOARD_RE.search(response.text)
+                    if api_match:
+                        board_token = api_match.group(1)
+
+                if board_token:
+                    self._gh_token_cache[company_name] = board_token
+                    self._gh_token_cache_dirty = True
+
             if board_token:
                 # Fetch jobs from Greenhouse API
                 api_url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
                 api_response = self.get(api_url)
-                
+
+                if not api_response and self._gh_token_cache.get(company_name) == board_token:
+                    # Cached token no longer resolves; drop it so the next
+                    # run rediscovers from the career page
+                    del self._gh_token_cache[company_name]
+                    self._gh_token_cache_dirty = True
+
                 if api_response:
                     try:
                         data = api_response.json()
@@ -168,14 +269,19 @@ class CompanyCareersScraper(BaseScraper):
                                 continue
                             locations = job.get('locations', [])
                             if isinstance(locations, list):
-                                location = ', '.join([str(loc.get('name', '')) for loc in locations if isinstance(loc, dict)])
+                                # Generator keeps join from building an
+                                # intermediate list; skipping empty names
+                                # avoids ', , ' artifacts
+                                location = ', '.join(
+                                    name for loc in locations if isinstance(loc, dict)
+                                    if (name := str(loc.get('name', '')).strip())
+                                )
                             else:
                                 location = ''
                             job_url = str(job.get('absolute_url', '')).strip()
                             
                             # Check if job matches search terms
-                            title_lower = title.lower()
-                            if any(term.lower() in title_lower for term in search_terms):
+                            if terms_re.search(title):
                                 jobs.append({
                                     'title': title,
                                     'company': str(company_name),
@@ -191,12 +297,21 @@ class CompanyCareersScraper(BaseScraper):
                     except Exception as e:
                         logger.warning(f"Unexpected error parsing Greenhouse API for {company_name}: {e}")
             
-            # Fallback: scrape HTML directly
+            # Fallback: scrape HTML directly. The soup is only built here,
+            # when the API path produced nothing.
             if not jobs:
-                job_elements = soup.find_all(['a', 'div'], class_=re.compile(r'job|position|opening', re.I))
+                if response is None:
+                    # Cache hit skipped the page fetch; get it now
+                    response = self.get(career_url)
+                    if not response:
+                        return jobs
+                soup = BeautifulSoup(response.content, HTML_PARSER,
+                                     parse_only=_GH_JOB_STRAINER)
+
+                job_elements = soup.find_all(['a', 'div'], class_=_JOB_CLASS_RE)
                 
                 for element in job_elements:
-                    title_elem = element.find(['h2', 'h3', 'h4', 'span'], class_=re.compile(r'title|name', re.I))
+                    title_elem = element.find(['h2', 'h3', 'h4', 'span'], class_=_TITLE_CLASS_RE)
                     if not title_elem:
                         title_elem = element
                     
@@ -205,12 +320,11 @@ class CompanyCareersScraper(BaseScraper):
                         continue
                     
                     # Check if matches search terms
-                    title_lower = title.lower()
-                    if not any(term.lower() in title_lower for term in search_terms):
+                    if not terms_re.search(title):
                         continue
                     
                     # Extract location
-                    location_elem = element.find(['span', 'div'], class_=re.compile(r'location', re.I))
+                    location_elem = element.find(['span', 'div'], class_=_LOCATION_CLASS_RE)
                     location = self._extract_text(location_elem) if location_elem else ''
                     
                     # Extract URL
@@ -249,6 +363,7 @@ class CompanyCareersScraper(BaseScraper):
             List of job dictionaries
         """
         jobs = []
+        terms_re = _compile_search_terms(search_terms)
         
         try:
             # Lever API endpoint
@@ -276,7 +391,7 @@ class CompanyCareersScraper(BaseScraper):
                         if isinstance(categories, dict):
                             locations = categories.get('location', [])
                             if isinstance(locations, list):
-                                location = ', '.join([str(loc) for loc in locations])
+                                location = ', '.join(str(loc) for loc in locations if loc)
                             else:
                                 location = ''
                         else:
@@ -285,8 +400,7 @@ class CompanyCareersScraper(BaseScraper):
                         if job_url and not job_url.startswith('http'):
                             job_url = self._normalize_url(job_url, career_url)
                         
-                        title_lower = title.lower()
-                        if any(term.lower() in title_lower for term in search_terms):
+                        if terms_re.search(title):
                             jobs.append({
                                 'title': title,
                                 'company': str(company_name),
@@ -304,11 +418,12 @@ class CompanyCareersScraper(BaseScraper):
             
             # Fallback: scrape HTML
             if not jobs:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_elements = soup.find_all(['a', 'div'], class_=re.compile(r'posting|job', re.I))
+                soup = BeautifulSoup(response.content, HTML_PARSER,
+                                     parse_only=_LEVER_JOB_STRAINER)
+                job_elements = soup.find_all(['a', 'div'], class_=_POSTING_CLASS_RE)
                 
                 for element in job_elements:
-                    title_elem = element.find(['h3', 'h4', 'h5', 'span'], class_=re.compile(r'title|name', re.I))
+                    title_elem = element.find(['h3', 'h4', 'h5', 'span'], class_=_TITLE_CLASS_RE)
                     if not title_elem:
                         title_elem = element
                     
@@ -316,11 +431,10 @@ class CompanyCareersScraper(BaseScraper):
                     if not title:
                         continue
                     
-                    title_lower = title.lower()
-                    if not any(term.lower() in title_lower for term in search_terms):
+                    if not terms_re.search(title):
                         continue
                     
-                    location_elem = element.find(['span', 'div'], class_=re.compile(r'location', re.I))
+                    location_elem = element.find(['span', 'div'], class_=_LOCATION_CLASS_RE)
                     location = self._extract_text(location_elem) if location_elem else ''
                     
                     link = element.find('a', href=True) if element.name != 'a' else element
@@ -374,50 +488,11 @@ class CompanyCareersScraper(BaseScraper):
                 })
                 return jobs
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
-            # Common patterns for job listings - expanded selectors
-            # Look for links, divs, or list items that might contain jobs
-            job_selectors = [
-                'a[href*="job"]',
-                'a[href*="career"]',
-                'a[href*="position"]',
-                'a[href*="opening"]',
-                'a[href*="role"]',
-                'div.job',
-                'div.position',
-                'div.opening',
-                'div.role',
-                'li.job',
-                'li.position',
-                'li.opening',
-                'article.job',
-                'article.position',
-                '[class*="job"]',
-                '[class*="position"]',
-                '[class*="opening"]',
-                '[class*="role"]',
-                '[class*="vacancy"]',
-                '[data-job-id]',
-                '[data-position-id]',
-            ]
-            
-            job_elements = []
-            for selector in job_selectors:
-                try:
-                    elements = soup.select(selector)
-                    job_elements.extend(elements)
-                except Exception:
-                    continue
-            
-            # Remove duplicates
-            seen = set()
-            unique_elements = []
-            for elem in job_elements:
-                elem_id = id(elem)
-                if elem_id not in seen:
-                    seen.add(elem_id)
-                    unique_elements.append(elem)
+            # Common patterns for job listings - one pre-compiled selector
+            # group covering links, divs, and list items that might hold jobs
+            unique_elements = _JOB_SELECTOR.select(soup)
             
             # Diagnostic: log what we found
             if len(unique_elements) == 0:
@@ -450,8 +525,8 @@ class CompanyCareersScraper(BaseScraper):
             for element in unique_elements:
                 # Extract title
                 title_elem = (
-                    element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'], class_=re.compile(r'title|name|heading', re.I)) or
-                    element.find('span', class_=re.compile(r'title|name', re.I)) or
+                    element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'], class_=_TITLE_HEADING_CLASS_RE) or
+                    element.find('span', class_=_TITLE_CLASS_RE) or
                     element.find('a') or
                     element
                 )
@@ -468,14 +543,14 @@ class CompanyCareersScraper(BaseScraper):
                 
                 # Extract location
                 location = ''
-                location_elem = element.find(['span', 'div', 'p'], class_=re.compile(r'location|city|place', re.I))
+                location_elem = element.find(['span', 'div', 'p'], class_=_LOCATION_WIDE_CLASS_RE)
                 if location_elem:
                     location = self._extract_text(location_elem)
                 else:
                     # Try to find location in nearby elements
                     parent = element.parent
                     if parent:
-                        loc_elem = parent.find(['span', 'div'], class_=re.compile(r'location', re.I))
+                        loc_elem = parent.find(['span', 'div'], class_=_LOCATION_CLASS_RE)
                         if loc_elem:
                             location = self._extract_text(loc_elem)
                 
@@ -487,7 +562,7 @@ class CompanyCareersScraper(BaseScraper):
                     job_url = career_url
                 
                 # Extract description if available
-                desc_elem = element.find(['p', 'div'], class_=re.compile(r'description|summary', re.I))
+                desc_elem = element.find(['p', 'div'], class_=_DESC_CLASS_RE)
                 description = self._extract_text(desc_elem) if desc_elem else ''
                 
                 jobs.append({
@@ -589,9 +664,6 @@ class CompanyCareersScraper(BaseScraper):
         if jobs or not self.browser_fallback.enabled:
             return jobs
 
-        if self._browser_companies_used >= BROWSER_MAX_COMPANIES:
-            return jobs
-
         career_url = str(company_info.get("career_url", "")).strip()
         scraper_type = str(company_info.get("scraper_type", "custom")).lower()
         search_terms = company_info.get("search_terms", SEARCH_TERMS)
@@ -600,34 +672,34 @@ class CompanyCareersScraper(BaseScraper):
         if not career_url.startswith(("http://", "https://")):
             return jobs
 
-        try:
-            self._browser_companies_used += 1
-            browser_jobs = self.browser_fallback.scrape_company(
-                company_name, career_url, search_terms
-            )
-            if browser_jobs:
-                # Mark previous zero_jobs failure, if any, as browser_success
-                for item in self.failures:
-                    if (
-                        item.get("company") == company_name
-                        and item.get("stage") == "result"
-                        and item.get("error") == "zero_jobs"
-                    ):
-                        item["error"] = "browser_success"
-                return browser_jobs
-        except Exception as e:
-            logger.warning(
-                "Browser fallback failed for %s (%s): %s", company_name, career_url, e
-            )
-            self.failures.append(
-                {
-                    "company": company_name,
-                    "career_url": career_url,
-                    "scraper_type": scraper_type,
-                    "stage": "browser",
-                    "error": str(e),
-                }
-            )
+        with self._browser_lock:
+            if self._browser_companies_used >= BROWSER_MAX_COMPANIES:
+                return jobs
+
+            try:
+                self._browser_companies_used += 1
+                browser_jobs = self.browser_fallback.scrape_company(
+                    company_name, career_url, search_terms
+                )
+                if browser_jobs:
+                    # Mark previous zero_jobs failure, if any, as browser_success
+                    entry = self._zero_job_failures.get(company_name)
+                    if entry is not None:
+                        entry["error"] = "browser_success"
+                    return browser_jobs
+            except Exception as e:
+                logger.warning(
+                    "Browser fallback failed for %s (%s): %s", company_name, career_url, e
+                )
+                self.failures.append(
+                    {
+                        "company": company_name,
+                        "career_url": career_url,
+                        "scraper_type": scraper_type,
+                        "stage": "browser",
+                        "error": str(e),
+                    }
+                )
 
         return jobs
     
@@ -639,17 +711,32 @@ class CompanyCareersScraper(BaseScraper):
             List of all job dictionaries
         """
         all_jobs = []
-        
-        for company_name, company_info in self.companies.items():
-            try:
-                jobs = self.scrape_company_with_fallback(company_name, company_info)
-                all_jobs.extend(jobs)
-                logger.info(f"Found {len(jobs)} jobs at {company_name}")
-                if len(jobs) == 0:
-                    # record a soft failure so you can tune URLs/scraper types later
-                    diagnostic = f"Scraper ran successfully but found 0 jobs matching criteria"
-                    self.failures.append(
-                        {
+
+        if not self.companies:
+            return all_jobs
+
+        # Companies are independent hosts, so scrape them concurrently; the
+        # per-host rate limit in BaseScraper keeps each host polite and the
+        # browser fallback serializes internally on its lock.
+        max_workers = min(SCRAPER_MAX_WORKERS, len(self.companies))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.scrape_company_with_fallback, company_name, company_info
+                ): (company_name, company_info)
+                for company_name, company_info in self.companies.items()
+            }
+
+            for future in as_completed(futures):
+                company_name, company_info = futures[future]
+                try:
+                    jobs = future.result()
+                    all_jobs.extend(jobs)
+                    logger.info(f"Found {len(jobs)} jobs at {company_name}")
+                    if len(jobs) == 0:
+                        # record a soft failure so you can tune URLs/scraper types later
+                        diagnostic = f"Scraper ran successfully but found 0 jobs matching criteria"
+                        record = {
                             "company": company_name,
                             "career_url": str(company_info.get("career_url", "")),
                             "scraper_type": str(company_info.get("scraper_type", "")),
@@ -657,22 +744,25 @@ class CompanyCareersScraper(BaseScraper):
                             "error": "zero_jobs",
                             "diagnostic": diagnostic,
                         }
+                        self.failures.append(record)
+                        self._zero_job_failures[company_name] = record
+                except Exception as e:
+                    logger.error(f"Error scraping {company_name}: {e}")
+                    diagnostic = f"Exception in scrape loop: {type(e).__name__}: {str(e)}"
+                    self.failures.append(
+                        {
+                            "company": company_name,
+                            "career_url": str(company_info.get("career_url", "")),
+                            "scraper_type": str(company_info.get("scraper_type", "")),
+                            "stage": "loop",
+                            "error": str(e),
+                            "diagnostic": diagnostic,
+                        }
                     )
-            except Exception as e:
-                logger.error(f"Error scraping {company_name}: {e}")
-                diagnostic = f"Exception in scrape loop: {type(e).__name__}: {str(e)}"
-                self.failures.append(
-                    {
-                        "company": company_name,
-                        "career_url": str(company_info.get("career_url", "")),
-                        "scraper_type": str(company_info.get("scraper_type", "")),
-                        "stage": "loop",
-                        "error": str(e),
-                        "diagnostic": diagnostic,
-                    }
-                )
-                continue
+                    continue
         
+        self._save_gh_token_cache()
+
         try:
             self.failure_reporter.write(self.failures)
             logger.info(f"Wrote failure report: {self.failure_reporter.output_file}")
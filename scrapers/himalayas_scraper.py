@@ -1,10 +1,12 @@
 """Himalayas job scraper (best-effort RSS)."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, HTML_PARSER, iter_rss_items
 from utils.config import SEARCH_TERMS
 
 logger = logging.getLogger(__name__)
@@ -25,33 +27,54 @@ class HimalayasScraper(BaseScraper):
             "https://himalayas.app/jobs.rss",
         ]
 
+    def _fetch_first_rss(self):
+        """Probe all RSS candidates concurrently, returning the first success.
+
+        Probing serially meant a dead candidate cost its full request
+        timeout before the next URL was even tried. Candidates are fired
+        together and the first non-empty response wins; the pool is shut
+        down without waiting on the losers.
+        """
+        headers = {"Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8"}
+        executor = ThreadPoolExecutor(max_workers=len(self.rss_candidates))
+        try:
+            futures = [
+                executor.submit(self.get, url, headers=headers)
+                for url in self.rss_candidates
+            ]
+            for future in as_completed(futures):
+                try:
+                    resp = future.result()
+                except Exception as e:
+                    logger.debug("Himalayas RSS candidate failed: %s", e)
+                    continue
+                if resp and resp.content:
+                    return resp
+            return None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def scrape(self, keywords: Optional[List[str]] = None, max_results: int = 200) -> List[Dict]:
         if keywords is None:
             keywords = SEARCH_TERMS
 
-        resp = None
-        for url in self.rss_candidates:
-            resp = self.get(url, headers={"Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8"})
-            if resp and resp.text:
-                break
-
+        resp = self._fetch_first_rss()
         if not resp:
             return []
 
-        soup = BeautifulSoup(resp.text, "xml")
-        items = soup.find_all("item")
-        if not items:
-            return []
-
         jobs: List[Dict] = []
         # Removed early keyword filtering - let main JobFilter handle it
 
-        for item in items:
+        for item in islice(iter_rss_items(resp.content), max_results):
             title = (item.findtext("title") or "").strip()
             url = (item.findtext("link") or "").strip()
             description = (item.findtext("description") or "").strip()
             posted = (item.findtext("pubDate") or "").strip()
 
+            # Only pay for a soup when the description actually has markup
+            if "<" in description:
+                description = BeautifulSoup(description, HTML_PARSER).get_text(" ", strip=True)
+
             jobs.append(
                 {
                     "title": title,
@@ -59,14 +82,10 @@ class HimalayasScraper(BaseScraper):
                     "location": "Remote",
                     "url": url,
                     "experience": "",
-                    "description": BeautifulSoup(description, "html.parser").get_text(" ", strip=True),
+                    "description": description,
                     "posted_date": posted,
                     "source": "Himalayas",
                 }
             )
 
-            if len(jobs) >= max_results:
-                break
-
         return jobs
-
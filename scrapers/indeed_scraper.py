@@ -2,15 +2,31 @@
 
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
 from urllib.parse import urlencode
-from bs4 import BeautifulSoup
-from scrapers.base_scraper import BaseScraper
-from utils.config import SEARCH_TERMS
+from bs4 import BeautifulSoup, SoupStrainer
+from scrapers.base_scraper import BaseScraper, HTML_PARSER
+from utils.config import SEARCH_TERMS, SCRAPER_MAX_WORKERS
+from utils.seen_urls import SeenUrls
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Class/href patterns used on every element of every card, compiled once
+# at import instead of inside each find call in the card loop
+_CARD_CLASS_RE = re.compile(r'job|result', re.I)
+_TITLE_CLASS_RE = re.compile(r'title|jobTitle', re.I)
+_VIEWJOB_HREF_RE = re.compile(r'/viewjob', re.I)
+_COMPANY_CLASS_RE = re.compile(r'company', re.I)
+_LOCATION_CLASS_RE = re.compile(r'location', re.I)
+_DESC_CLASS_RE = re.compile(r'summary|snippet', re.I)
+_DATE_CLASS_RE = re.compile(r'date', re.I)
+
+# Only elements that can be job cards (and their subtrees) are worth
+# materializing; the strainer drops the rest of the page at parse time
+_CARD_STRAINER = SoupStrainer(['div', 'a'], class_=_CARD_CLASS_RE)
+
 
 class IndeedScraper(BaseScraper):
     """Scraper for Indeed.com jobs."""
@@ -19,6 +35,7 @@ class IndeedScraper(BaseScraper):
         """Initialize Indeed scraper."""
         super().__init__()
         self.base_url = "https://in.indeed.com"
+        self._seen_urls = SeenUrls('Indeed')
     
     def scrape(self, keywords: List[str] = None, location: str = "India", max_results: int = 100) -> List[Dict]:
         """
@@ -36,16 +53,29 @@ class IndeedScraper(BaseScraper):
             keywords = SEARCH_TERMS
         
         all_jobs = []
-        
-        for keyword in keywords:
-            try:
-                jobs = self._search_jobs(keyword, location, max_results)
-                all_jobs.extend(jobs)
-                logger.info(f"Found {len(jobs)} jobs for '{keyword}' on Indeed")
-            except Exception as e:
-                logger.error(f"Error scraping Indeed for '{keyword}': {e}")
-                continue
-        
+
+        if not keywords:
+            return all_jobs
+
+        # Keyword searches are independent fetches, so run them on a small
+        # pool; the per-host rate limit in BaseScraper keeps the shared
+        # host polite while parsing overlaps the network waits
+        max_workers = min(SCRAPER_MAX_WORKERS, len(keywords))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._search_jobs, keyword, location, max_results): keyword
+                for keyword in keywords
+            }
+            for future in as_completed(futures):
+                keyword = futures[future]
+                try:
+                    jobs = future.result()
+                    all_jobs.extend(jobs)
+                    logger.info(f"Found {len(jobs)} jobs for '{keyword}' on Indeed")
+                except Exception as e:
+                    logger.error(f"Error scraping Indeed for '{keyword}': {e}")
+
+        self._seen_urls.save()
         return all_jobs
     
     def _search_jobs(self, keyword: str, location: str, max_results: int) -> List[Dict]:
@@ -67,18 +97,19 @@ class IndeedScraper(BaseScraper):
             if not response:
                 return jobs
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER,
+                                 parse_only=_CARD_STRAINER)
             
             # Indeed job card selectors
-            job_cards = soup.find_all(['div', 'a'], class_=re.compile(r'job|result', re.I))
+            job_cards = soup.find_all(['div', 'a'], class_=_CARD_CLASS_RE)
             
             for card in job_cards:
                 try:
-                    # Extract job title
+                    # Extract job title - one walk over the card's
+                    # subtree instead of a find per tag/attribute fallback
                     title_elem = (
-                        card.find('a', class_=re.compile(r'title|jobTitle', re.I)) or
-                        card.find('h2', class_=re.compile(r'title', re.I)) or
-                        card.find('a', href=re.compile(r'/viewjob', re.I))
+                        card.find(['a', 'h2'], class_=_TITLE_CLASS_RE) or
+                        card.find('a', href=_VIEWJOB_HREF_RE)
                     )
                     
                     if not title_elem:
@@ -87,42 +118,39 @@ class IndeedScraper(BaseScraper):
                     title = title_elem.get_text(strip=True)
                     if not title or len(title) < 5:
                         continue
-                    
-                    # Extract company
-                    company_elem = (
-                        card.find('span', class_=re.compile(r'company', re.I)) or
-                        card.find('div', class_=re.compile(r'company', re.I)) or
-                        card.find('a', class_=re.compile(r'company', re.I))
-                    )
-                    company = company_elem.get_text(strip=True) if company_elem else ''
-                    
-                    # Extract location
-                    location_elem = (
-                        card.find('div', class_=re.compile(r'location', re.I)) or
-                        card.find('span', class_=re.compile(r'location', re.I))
-                    )
-                    job_location = location_elem.get_text(strip=True) if location_elem else location
-                    
-                    # Extract URL
+
+                    # Resolve the URL before the remaining fields: a card
+                    # seen in a recent run is skipped right here
                     if title_elem.name == 'a' and title_elem.get('href'):
                         job_url = title_elem['href']
                         if not job_url.startswith('http'):
                             job_url = self.base_url + job_url
                     else:
-                        link = card.find('a', href=re.compile(r'/viewjob', re.I))
+                        link = card.find('a', href=_VIEWJOB_HREF_RE)
                         if link:
                             job_url = link['href']
                             if not job_url.startswith('http'):
                                 job_url = self.base_url + job_url
                         else:
                             continue
+
+                    if self._seen_urls.check_and_mark(job_url):
+                        continue
+
+                    # Extract company
+                    company_elem = card.find(['span', 'div', 'a'], class_=_COMPANY_CLASS_RE)
+                    company = company_elem.get_text(strip=True) if company_elem else ''
+                    
+                    # Extract location
+                    location_elem = card.find(['div', 'span'], class_=_LOCATION_CLASS_RE)
+                    job_location = location_elem.get_text(strip=True) if location_elem else location
                     
                     # Extract description snippet
-                    desc_elem = card.find(['div', 'span'], class_=re.compile(r'summary|snippet', re.I))
+                    desc_elem = card.find(['div', 'span'], class_=_DESC_CLASS_RE)
                     description = desc_elem.get_text(strip=True) if desc_elem else ''
                     
                     # Extract posted date
-                    date_elem = card.find('span', class_=re.compile(r'date', re.I))
+                    date_elem = card.find('span', class_=_DATE_CLASS_RE)
                     posted_date = date_elem.get_text(strip=True) if date_elem else ''
                     
                     jobs.append({
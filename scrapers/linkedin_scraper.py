@@ -2,15 +2,29 @@
 
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
 from urllib.parse import urlencode, quote
-from bs4 import BeautifulSoup
-from scrapers.base_scraper import BaseScraper
-from utils.config import SEARCH_TERMS, INDIA_LOCATIONS
+from bs4 import BeautifulSoup, SoupStrainer
+from scrapers.base_scraper import BaseScraper, HTML_PARSER
+from utils.config import SEARCH_TERMS, SCRAPER_MAX_WORKERS, INDIA_LOCATIONS
+from utils.seen_urls import SeenUrls
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Class patterns used on every element of every card, compiled once at
+# import instead of inside each find call in the card loop
+_CARD_CLASS_RE = re.compile(r'job|result|card', re.I)
+_TITLE_CLASS_RE = re.compile(r'title|job-title', re.I)
+_COMPANY_CLASS_RE = re.compile(r'company', re.I)
+_LOCATION_CLASS_RE = re.compile(r'location', re.I)
+_DESC_CLASS_RE = re.compile(r'description|snippet', re.I)
+
+# Only elements that can be job cards (and their subtrees) are worth
+# materializing; the strainer drops the rest of the page at parse time
+_CARD_STRAINER = SoupStrainer(['div', 'li'], class_=_CARD_CLASS_RE)
+
 
 class LinkedInScraper(BaseScraper):
     """Scraper for LinkedIn jobs."""
@@ -19,6 +33,7 @@ class LinkedInScraper(BaseScraper):
         """Initialize LinkedIn scraper."""
         super().__init__()
         self.base_url = "https://www.linkedin.com/jobs/search"
+        self._seen_urls = SeenUrls('LinkedIn')
     
     def scrape(self, keywords: List[str] = None, location: str = "India", max_results: int = 100) -> List[Dict]:
         """
@@ -36,16 +51,29 @@ class LinkedInScraper(BaseScraper):
             keywords = SEARCH_TERMS
         
         all_jobs = []
-        
-        for keyword in keywords:
-            try:
-                jobs = self._search_jobs(keyword, location, max_results)
-                all_jobs.extend(jobs)
-                logger.info(f"Found {len(jobs)} jobs for '{keyword}' on LinkedIn")
-            except Exception as e:
-                logger.error(f"Error scraping LinkedIn for '{keyword}': {e}")
-                continue
-        
+
+        if not keywords:
+            return all_jobs
+
+        # Keyword searches are independent fetches, so run them on a small
+        # pool; the per-host rate limit in BaseScraper keeps the shared
+        # host polite while parsing overlaps the network waits
+        max_workers = min(SCRAPER_MAX_WORKERS, len(keywords))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._search_jobs, keyword, location, max_results): keyword
+                for keyword in keywords
+            }
+            for future in as_completed(futures):
+                keyword = futures[future]
+                try:
+                    jobs = future.result()
+                    all_jobs.extend(jobs)
+                    logger.info(f"Found {len(jobs)} jobs for '{keyword}' on LinkedIn")
+                except Exception as e:
+                    logger.error(f"Error scraping LinkedIn for '{keyword}': {e}")
+
+        self._seen_urls.save()
         return all_jobs
     
     def _search_jobs(self, keyword: str, location: str, max_results: int) -> List[Dict]:
@@ -81,26 +109,24 @@ class LinkedInScraper(BaseScraper):
                     logger.warning(f"LinkedIn: Redirected to login/authwall for keyword '{keyword}' - likely requires authentication")
                     return jobs
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER,
+                                 parse_only=_CARD_STRAINER)
             
             # LinkedIn uses different structures - try multiple selectors
-            job_cards = soup.find_all(['div', 'li'], class_=re.compile(r'job|result|card', re.I))
+            job_cards = soup.find_all(['div', 'li'], class_=_CARD_CLASS_RE)
             
             # Diagnostic: log what we found
             if len(job_cards) == 0:
                 logger.debug(f"LinkedIn: Found 0 job cards for '{keyword}'. Response length: {len(response.text)} chars")
                 # Try to see if there's a different structure
                 all_divs = soup.find_all('div')
-                logger.debug(f"LinkedIn: Total divs in page: {len(all_divs)}")
+                logger.debug(f"LinkedIn: Candidate divs in strained page: {len(all_divs)}")
             
             for card in job_cards:
                 try:
-                    # Extract job title
-                    title_elem = (
-                        card.find('a', class_=re.compile(r'title|job-title', re.I)) or
-                        card.find('h3', class_=re.compile(r'title', re.I)) or
-                        card.find('span', class_=re.compile(r'title', re.I))
-                    )
+                    # Extract job title - one walk over the card's
+                    # subtree instead of a find per tag fallback
+                    title_elem = card.find(['a', 'h3', 'span'], class_=_TITLE_CLASS_RE)
                     
                     if not title_elem:
                         continue
@@ -108,23 +134,9 @@ class LinkedInScraper(BaseScraper):
                     title = title_elem.get_text(strip=True)
                     if not title or len(title) < 5:
                         continue
-                    
-                    # Extract company
-                    company_elem = (
-                        card.find('a', class_=re.compile(r'company', re.I)) or
-                        card.find('h4', class_=re.compile(r'company', re.I)) or
-                        card.find('span', class_=re.compile(r'company', re.I))
-                    )
-                    company = company_elem.get_text(strip=True) if company_elem else ''
-                    
-                    # Extract location
-                    location_elem = (
-                        card.find('span', class_=re.compile(r'location', re.I)) or
-                        card.find('div', class_=re.compile(r'location', re.I))
-                    )
-                    job_location = location_elem.get_text(strip=True) if location_elem else location
-                    
-                    # Extract URL
+
+                    # Resolve the URL before the remaining fields: a card
+                    # seen in a recent run is skipped right here
                     link = title_elem.find('a', href=True) if title_elem.name != 'a' else title_elem
                     if link and link.get('href'):
                         job_url = link['href']
@@ -132,9 +144,20 @@ class LinkedInScraper(BaseScraper):
                             job_url = 'https://www.linkedin.com' + job_url
                     else:
                         continue
+
+                    if self._seen_urls.check_and_mark(job_url):
+                        continue
+
+                    # Extract company
+                    company_elem = card.find(['a', 'h4', 'span'], class_=_COMPANY_CLASS_RE)
+                    company = company_elem.get_text(strip=True) if company_elem else ''
+                    
+                    # Extract location
+                    location_elem = card.find(['span', 'div'], class_=_LOCATION_CLASS_RE)
+                    job_location = location_elem.get_text(strip=True) if location_elem else location
                     
                     # Extract description snippet
-                    desc_elem = card.find(['p', 'div'], class_=re.compile(r'description|snippet', re.I))
+                    desc_elem = card.find(['p', 'div'], class_=_DESC_CLASS_RE)
                     description = desc_elem.get_text(strip=True) if desc_elem else ''
                     
                     jobs.append({
@@ -2,15 +2,30 @@
 
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
 from urllib.parse import urlencode
 from bs4 import BeautifulSoup
-from scrapers.base_scraper import BaseScraper
-from utils.config import SEARCH_TERMS
+from scrapers.base_scraper import BaseScraper, HTML_PARSER
+from utils.config import SEARCH_TERMS, SCRAPER_MAX_WORKERS
+from utils.seen_urls import SeenUrls
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Class/href patterns used on every element of every card, compiled once
+# at import instead of inside each find call in the card loop
+_TUPLE_CLASS_RE = re.compile(r'jobTuple|jobCard', re.I)
+_TUPLE_WIDE_CLASS_RE = re.compile(r'jobTuple|jobCard|row', re.I)
+_CARD_CLASS_RE = re.compile(r'job|tuple|row', re.I)
+_NO_RESULTS_CLASS_RE = re.compile(r'noResults|no-jobs', re.I)
+_TITLE_CLASS_RE = re.compile(r'title|jobTitle|job.*title', re.I)
+_JOB_DETAILS_HREF_RE = re.compile(r'/job-details/', re.I)
+_COMPANY_CLASS_RE = re.compile(r'company|compName', re.I)
+_LOCATION_CLASS_RE = re.compile(r'location|loc', re.I)
+_EXP_CLASS_RE = re.compile(r'exp', re.I)
+_DESC_CLASS_RE = re.compile(r'description|summary', re.I)
+
 
 class NaukriScraper(BaseScraper):
     """Scraper for Naukri.com jobs."""
@@ -19,6 +34,7 @@ class NaukriScraper(BaseScraper):
         """Initialize Naukri scraper."""
         super().__init__()
         self.base_url = "https://www.naukri.com"
+        self._seen_urls = SeenUrls('Naukri')
     
     def scrape(self, keywords: List[str] = None, experience: str = "0-3", location: str = "india", max_results: int = 100) -> List[Dict]:
         """
@@ -37,16 +53,31 @@ class NaukriScraper(BaseScraper):
             keywords = SEARCH_TERMS
         
         all_jobs = []
-        
-        for keyword in keywords:
-            try:
-                jobs = self._search_jobs(keyword, experience, location, max_results)
-                all_jobs.extend(jobs)
-                logger.info(f"Found {len(jobs)} jobs for '{keyword}' in '{location}' on Naukri")
-            except Exception as e:
-                logger.error(f"Error scraping Naukri for '{keyword}' in '{location}': {e}")
-                continue
-        
+
+        if not keywords:
+            return all_jobs
+
+        # Keyword searches are independent fetches, so run them on a small
+        # pool; the per-host rate limit in BaseScraper keeps the shared
+        # host polite while parsing overlaps the network waits
+        max_workers = min(SCRAPER_MAX_WORKERS, len(keywords))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._search_jobs, keyword, experience, location, max_results
+                ): keyword
+                for keyword in keywords
+            }
+            for future in as_completed(futures):
+                keyword = futures[future]
+                try:
+                    jobs = future.result()
+                    all_jobs.extend(jobs)
+                    logger.info(f"Found {len(jobs)} jobs for '{keyword}' in '{location}' on Naukri")
+                except Exception as e:
+                    logger.error(f"Error scraping Naukri for '{keyword}' in '{location}': {e}")
+
+        self._seen_urls.save()
         return all_jobs
     
     def _search_jobs(self, keyword: str, experience: str, location: str, max_results: int) -> List[Dict]:
@@ -94,35 +125,34 @@ class NaukriScraper(BaseScraper):
                 return jobs
         
         try:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Naukri job listing selectors - try multiple patterns
             job_cards = (
-                soup.find_all('article', class_=re.compile(r'jobTuple|jobCard', re.I)) or
-                soup.find_all('div', class_=re.compile(r'jobTuple|jobCard|row', re.I)) or
+                soup.find_all('article', class_=_TUPLE_CLASS_RE) or
+                soup.find_all('div', class_=_TUPLE_WIDE_CLASS_RE) or
                 soup.find_all('div', {'data-job-id': True}) or
-                soup.find_all(['div', 'article'], class_=re.compile(r'job|tuple|row', re.I))
+                soup.find_all(['div', 'article'], class_=_CARD_CLASS_RE)
             )
             
             # Diagnostic: log what we found
             if len(job_cards) == 0:
                 logger.debug(f"Naukri: Found 0 job cards for '{keyword}'. Response length: {len(response.text)} chars")
                 # Check for common Naukri structures
-                if soup.find('div', class_=re.compile(r'noResults|no-jobs', re.I)):
+                if soup.find('div', class_=_NO_RESULTS_CLASS_RE):
                     logger.debug(f"Naukri: No results message found for '{keyword}'")
                 all_articles = soup.find_all('article')
                 logger.debug(f"Naukri: Total articles in page: {len(all_articles)}")
             
             for card in job_cards:
                 try:
-                    # Extract job title - try multiple selectors
+                    # Extract job title - fused walks: one find covers
+                    # the class-based fallbacks, and the redundant
+                    # select_one duplicate of the href find is dropped
                     title_elem = (
-                        card.find('a', class_=re.compile(r'title|jobTitle|job.*title', re.I)) or
+                        card.find(['a', 'h2', 'h3'], class_=_TITLE_CLASS_RE) or
                         card.find('a', title=True) or
-                        card.find('h2', class_=re.compile(r'title', re.I)) or
-                        card.find('h3', class_=re.compile(r'title', re.I)) or
-                        card.find('a', href=re.compile(r'/job-details/', re.I)) or
-                        card.select_one('a[href*="job-details"]')
+                        card.find('a', href=_JOB_DETAILS_HREF_RE)
                     )
                     
                     if not title_elem:
@@ -131,52 +161,46 @@ class NaukriScraper(BaseScraper):
                     title = title_elem.get_text(strip=True)
                     if not title or len(title) < 5:
                         continue
-                    
+
+                    # Resolve the URL before the remaining fields: a card
+                    # seen in a recent run is skipped right here
+                    job_url = None
+                    if title_elem.name == 'a' and title_elem.get('href'):
+                        job_url = title_elem['href']
+                    else:
+                        link = card.find('a', href=_JOB_DETAILS_HREF_RE)
+                        if link:
+                            job_url = link.get('href')
+
+                    if not job_url:
+                        continue
+
+                    if not job_url.startswith('http'):
+                        job_url = self.base_url + job_url
+
+                    if self._seen_urls.check_and_mark(job_url):
+                        continue
+
                     # Extract company - try multiple selectors
                     company_elem = (
-                        card.find('a', class_=re.compile(r'company|compName', re.I)) or
-                        card.find('span', class_=re.compile(r'company|compName', re.I)) or
-                        card.find('div', class_=re.compile(r'company|compName', re.I)) or
+                        card.find(['a', 'span', 'div'], class_=_COMPANY_CLASS_RE) or
                         card.select_one('[class*="company"]')
                     )
                     company = company_elem.get_text(strip=True) if company_elem else ''
                     
                     # Extract location - try multiple selectors
                     location_elem = (
-                        card.find('span', class_=re.compile(r'location|loc', re.I)) or
-                        card.find('li', class_=re.compile(r'location|loc', re.I)) or
-                        card.find('div', class_=re.compile(r'location|loc', re.I)) or
+                        card.find(['span', 'li', 'div'], class_=_LOCATION_CLASS_RE) or
                         card.select_one('[class*="location"]')
                     )
                     job_location = location_elem.get_text(strip=True) if location_elem else 'India'
                     
-                    # Extract URL - try multiple patterns
-                    job_url = None
-                    if title_elem.name == 'a' and title_elem.get('href'):
-                        job_url = title_elem['href']
-                    else:
-                        link = (
-                            card.find('a', href=re.compile(r'/job-details/', re.I)) or
-                            card.select_one('a[href*="job-details"]')
-                        )
-                        if link:
-                            job_url = link.get('href')
-                    
-                    if not job_url:
-                        continue
-                    
-                    if not job_url.startswith('http'):
-                        job_url = self.base_url + job_url
-                    
                     # Extract experience
-                    exp_elem = (
-                        card.find('span', class_=re.compile(r'exp', re.I)) or
-                        card.find('li', class_=re.compile(r'exp', re.I))
-                    )
+                    exp_elem = card.find(['span', 'li'], class_=_EXP_CLASS_RE)
                     experience_req = exp_elem.get_text(strip=True) if exp_elem else ''
                     
                     # Extract description
-                    desc_elem = card.find(['p', 'div'], class_=re.compile(r'description|summary', re.I))
+                    desc_elem = card.find(['p', 'div'], class_=_DESC_CLASS_RE)
                     description = desc_elem.get_text(strip=True) if desc_elem else ''
                     
                     jobs.append({
@@ -115,6 +115,27 @@ REQUEST_DELAY_MIN = 1  # Minimum delay between requests (seconds)
 REQUEST_DELAY_MAX = 3  # Maximum delay between requests (seconds)
 MAX_RETRIES = 3  # Maximum retry attempts for failed requests
 TIMEOUT = 30  # Request timeout in seconds
+SCRAPER_TIMEOUT_S = 120  # Hard wall-time cap per scraper task (seconds)
+SCRAPER_MAX_WORKERS = 8  # Worker threads for running scraper tasks
+
+# Minimum batch size before filter/score work is sharded across a process
+# pool; below this the fork/pickle overhead outweighs the parallelism
+PROCESS_POOL_MIN_JOBS = 5000
+
+# Shared on-disk HTTP cache for scraper GETs (optional; needs requests-cache
+# installed, otherwise a plain session is used). Short TTL so repeat runs and
+# iterative development skip re-fetching listing pages that haven't changed.
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_PATH = "data/.http_cache"
+HTTP_CACHE_TTL_S = 1800  # 30 minutes
+
+# Incremental scraping for the job boards (Indeed/LinkedIn/Naukri): URLs
+# seen within the rolling window are skipped before the expensive per-card
+# extraction. Per-run CSVs then list only novel jobs; the aggregate CSV
+# keeps full history. Disable for a complete re-scrape.
+SEEN_URLS_ENABLED = True
+SEEN_URLS_FILE = "data/.seen_urls.json"
+SEEN_URLS_MAX_AGE_DAYS = 7
 
 # Browser-based scraping (JS-heavy career sites) - optional
 USE_BROWSER_FALLBACK = True  # Try headless browser when HTML scraper finds zero jobs
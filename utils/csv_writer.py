@@ -1,13 +1,18 @@
 """CSV writer for job output with clickable URLs."""
 
 import csv
+import io
 import os
 import re
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 from urllib.parse import urlparse
 from utils.config import CSV_OUTPUT_FILE, MAX_DESCRIPTION_LENGTH
 
+# Buffer size for CSV file writes; a large buffer batches thousands of small
+# row writes into a handful of syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class CSVWriter:
     """Write jobs to CSV file with clickable URLs."""
@@ -146,83 +151,117 @@ class CSVWriter:
         # If URL doesn't pass validation, sanitize and return
         return self._sanitize_csv_value(url)
     
-    def write_jobs(self, jobs: List[Dict], mode: str = 'w'):
+    def _build_row(self, job: Dict) -> Optional[List[str]]:
         """
-        Write jobs to CSV file.
-        
+        Build a CSV row (list of values in fieldnames order) for a job.
+
+        Args:
+            job: Job dictionary
+
+        Returns:
+            List of column values, or None if the job is invalid
+        """
+        if not job or not isinstance(job, dict):
+            return None
+
+        # Handle new columns with defaults for backward compatibility
+        priority_score = job.get('priority_score', '')
+        days_since_posted = job.get('days_since_posted', '')
+        freshness = job.get('freshness', '')
+        salary = job.get('salary', '')
+        deadline = job.get('deadline', '')
+        days_until_deadline = job.get('days_until_deadline', '')
+        skills_match_pct = job.get('skills_match_pct', '')
+
+        # Automatically mark all new jobs as "Ready to Apply = Yes"
+        ready_to_apply = self._get_ready_to_apply_value(job)
+
+        return [
+            self._sanitize_csv_value(job.get('title', '') or ''),
+            self._sanitize_csv_value(job.get('company', '') or ''),
+            self._sanitize_csv_value(job.get('location', '') or ''),
+            self._sanitize_csv_value(job.get('experience', '') or ''),
+            self._format_url(job.get('url', '')),
+            self._sanitize_csv_value(job.get('posted_date', '') or ''),
+            self._sanitize_csv_value(job.get('source', '') or ''),
+            self._truncate_description(job.get('description', '') or ''),
+            self._sanitize_csv_value(str(priority_score) if priority_score != '' else ''),
+            self._sanitize_csv_value(str(days_since_posted) if days_since_posted != '' else ''),
+            self._sanitize_csv_value(str(freshness) if freshness else ''),
+            self._sanitize_csv_value(str(salary) if salary else ''),
+            self._sanitize_csv_value(str(deadline) if deadline else ''),
+            self._sanitize_csv_value(str(days_until_deadline) if days_until_deadline is not None else ''),
+            self._sanitize_csv_value(str(skills_match_pct) if skills_match_pct != '' else ''),
+            self._sanitize_csv_value(ready_to_apply),
+            self._sanitize_csv_value(job.get('applied', 'No') or 'No'),
+            self._sanitize_csv_value(job.get('applied_date', '') or ''),
+            self._sanitize_csv_value(job.get('application_method', '') or ''),
+            self._sanitize_csv_value(job.get('application_error', '') or ''),
+            self._sanitize_csv_value(job.get('status', 'Not Applied') or 'Not Applied'),
+            self._sanitize_csv_value(job.get('notes', '') or '')
+        ]
+
+    def _build_rows(self, jobs: List[Dict]) -> List[List[str]]:
+        """Build CSV rows for all valid jobs."""
+        rows = []
+        for job in jobs:
+            row = self._build_row(job)
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    def serialize(self, jobs: List[Dict]) -> str:
+        """
+        Format jobs into CSV text (data rows only, no header).
+
+        The aggregate file and the timestamped snapshot receive identical
+        rows, so serializing once and writing the same buffer to both
+        destinations halves the csv-module work.
+
         Args:
             jobs: List of job dictionaries
+
+        Returns:
+            CSV-formatted string of all valid rows
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(self._build_rows(jobs))
+        return buffer.getvalue()
+
+    def write_serialized(self, data: str, mode: str = 'w'):
+        """
+        Write pre-serialized CSV data to the main output file.
+
+        Args:
+            data: CSV text from serialize()
             mode: File write mode ('w' for overwrite, 'a' for append)
         """
         # Create data directory if it doesn't exist
         output_dir = os.path.dirname(self.output_file)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
-        
+
         file_exists = os.path.exists(self.output_file) and mode == 'a'
-        
-        with open(self.output_file, mode, newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=self.fieldnames)
-            
+
+        with open(self.output_file, mode, buffering=WRITE_BUFFER_SIZE,
+                  newline='', encoding='utf-8') as csvfile:
             # Write header if new file
             if not file_exists:
-                writer.writeheader()
-            
-            # Write jobs
-            for job in jobs:
-                if not job or not isinstance(job, dict):
-                    continue
-                
-                # Handle new columns with defaults for backward compatibility
-                priority_score = job.get('priority_score', '')
-                days_since_posted = job.get('days_since_posted', '')
-                freshness = job.get('freshness', '')
-                salary = job.get('salary', '')
-                deadline = job.get('deadline', '')
-                days_until_deadline = job.get('days_until_deadline', '')
-                skills_match_pct = job.get('skills_match_pct', '')
-                
-                # Automatically mark all new jobs as "Ready to Apply = Yes"
-                ready_to_apply = self._get_ready_to_apply_value(job)
-                
-                row = {
-                    'Job Title': self._sanitize_csv_value(job.get('title', '') or ''),
-                    'Company': self._sanitize_csv_value(job.get('company', '') or ''),
-                    'Location': self._sanitize_csv_value(job.get('location', '') or ''),
-                    'Experience Required': self._sanitize_csv_value(job.get('experience', '') or ''),
-                    'Job URL': self._format_url(job.get('url', '')),
-                    'Posted Date': self._sanitize_csv_value(job.get('posted_date', '') or ''),
-                    'Source': self._sanitize_csv_value(job.get('source', '') or ''),
-                    'Description': self._truncate_description(job.get('description', '') or ''),
-                    'Priority Score': self._sanitize_csv_value(str(priority_score) if priority_score != '' else ''),
-                    'Days Since Posted': self._sanitize_csv_value(str(days_since_posted) if days_since_posted != '' else ''),
-                    'Freshness': self._sanitize_csv_value(str(freshness) if freshness else ''),
-                    'Salary': self._sanitize_csv_value(str(salary) if salary else ''),
-                    'Deadline': self._sanitize_csv_value(str(deadline) if deadline else ''),
-                    'Days Until Deadline': self._sanitize_csv_value(str(days_until_deadline) if days_until_deadline is not None else ''),
-                    'Skills Match %': self._sanitize_csv_value(str(skills_match_pct) if skills_match_pct != '' else ''),
-                    'Ready to Apply': self._sanitize_csv_value(ready_to_apply),
-                    'Applied': self._sanitize_csv_value(job.get('applied', 'No') or 'No'),
-                    'Applied Date': self._sanitize_csv_value(job.get('applied_date', '') or ''),
-                    'Application Method': self._sanitize_csv_value(job.get('application_method', '') or ''),
-                    'Application Error': self._sanitize_csv_value(job.get('application_error', '') or ''),
-                    'Status': self._sanitize_csv_value(job.get('status', 'Not Applied') or 'Not Applied'),
-                    'Notes': self._sanitize_csv_value(job.get('notes', '') or '')
-                }
-                writer.writerow(row)
+                csv.writer(csvfile).writerow(self.fieldnames)
+            csvfile.write(data)
 
-    def write_timestamped_jobs(self, jobs: List[Dict], directory: str) -> str:
+    def write_timestamped_serialized(self, data: str, directory: str) -> str:
         """
-        Write jobs to a new CSV file whose name includes the current timestamp.
+        Write pre-serialized CSV data to a timestamped snapshot file.
 
         Args:
-            jobs: List of job dictionaries
+            data: CSV text from serialize()
             directory: Directory where timestamped CSV should be created
 
         Returns:
             Path to the created CSV file
         """
-        if not jobs:
+        if not data:
             return ""
 
         # Ensure directory exists
@@ -231,53 +270,37 @@ class CSVWriter:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = os.path.join(directory, f"jobs_{timestamp}.csv")
 
-        with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=self.fieldnames)
-            writer.writeheader()
-
-            for job in jobs:
-                if not job or not isinstance(job, dict):
-                    continue
-
-                # Handle new columns with defaults for backward compatibility
-                priority_score = job.get('priority_score', '')
-                days_since_posted = job.get('days_since_posted', '')
-                freshness = job.get('freshness', '')
-                salary = job.get('salary', '')
-                deadline = job.get('deadline', '')
-                days_until_deadline = job.get('days_until_deadline', '')
-                skills_match_pct = job.get('skills_match_pct', '')
-                
-                # Automatically mark all new jobs as "Ready to Apply = Yes"
-                ready_to_apply = self._get_ready_to_apply_value(job)
-
-                row = {
-                    'Job Title': self._sanitize_csv_value(job.get('title', '') or ''),
-                    'Company': self._sanitize_csv_value(job.get('company', '') or ''),
-                    'Location': self._sanitize_csv_value(job.get('location', '') or ''),
-                    'Experience Required': self._sanitize_csv_value(job.get('experience', '') or ''),
-                    'Job URL': self._format_url(job.get('url', '')),
-                    'Posted Date': self._sanitize_csv_value(job.get('posted_date', '') or ''),
-                    'Source': self._sanitize_csv_value(job.get('source', '') or ''),
-                    'Description': self._truncate_description(job.get('description', '') or ''),
-                    'Priority Score': self._sanitize_csv_value(str(priority_score) if priority_score != '' else ''),
-                    'Days Since Posted': self._sanitize_csv_value(str(days_since_posted) if days_since_posted != '' else ''),
-                    'Freshness': self._sanitize_csv_value(str(freshness) if freshness else ''),
-                    'Salary': self._sanitize_csv_value(str(salary) if salary else ''),
-                    'Deadline': self._sanitize_csv_value(str(deadline) if deadline else ''),
-                    'Days Until Deadline': self._sanitize_csv_value(str(days_until_deadline) if days_until_deadline is not None else ''),
-                    'Skills Match %': self._sanitize_csv_value(str(skills_match_pct) if skills_match_pct != '' else ''),
-                    'Ready to Apply': self._sanitize_csv_value(ready_to_apply),
-                    'Applied': self._sanitize_csv_value(job.get('applied', 'No') or 'No'),
-                    'Applied Date': self._sanitize_csv_value(job.get('applied_date', '') or ''),
-                    'Application Method': self._sanitize_csv_value(job.get('application_method', '') or ''),
-                    'Application Error': self._sanitize_csv_value(job.get('application_error', '') or ''),
-                    'Status': self._sanitize_csv_value(job.get('status', 'Not Applied') or 'Not Applied'),
-                    'Notes': self._sanitize_csv_value(job.get('notes', '') or '')
-                }
-                writer.writerow(row)
+        with open(output_path, "w", buffering=WRITE_BUFFER_SIZE,
+                  newline="", encoding="utf-8") as csvfile:
+            csv.writer(csvfile).writerow(self.fieldnames)
+            csvfile.write(data)
 
         return output_path
+
+    def write_jobs(self, jobs: List[Dict], mode: str = 'w'):
+        """
+        Write jobs to CSV file.
+
+        Args:
+            jobs: List of job dictionaries
+            mode: File write mode ('w' for overwrite, 'a' for append)
+        """
+        self.write_serialized(self.serialize(jobs), mode=mode)
+
+    def write_timestamped_jobs(self, jobs: List[Dict], directory: str) -> str:
+        """
+        Write jobs to a new CSV file whose name includes the current timestamp.
+
+        Args:
+            jobs: List of job dictionaries
+            directory: Directory where timestamped CSV should be created
+
+        Returns:
+            Path to the created CSV file
+        """
+        if not jobs:
+            return ""
+        return self.write_timestamped_serialized(self.serialize(jobs), directory)
     
     def append_jobs(self, jobs: List[Dict]):
         """
@@ -288,6 +311,57 @@ class CSVWriter:
         """
         self.write_jobs(jobs, mode='a')
     
+    def _url_cache_path(self) -> str:
+        """Path of the URL sidecar cache next to the aggregate CSV."""
+        return self.output_file + '.urls'
+
+    def get_existing_urls_cached(self) -> set:
+        """
+        Get existing job URLs, served from a sidecar cache when fresh.
+
+        Parsing the whole aggregate CSV just to rebuild the URL set costs a
+        full csv.DictReader pass every run. The sidecar file holds one URL
+        per line and is valid while it is at least as new as the CSV; on a
+        miss the CSV is parsed once and the cache rewritten.
+
+        Returns:
+            Set of existing job URLs
+        """
+        cache_path = self._url_cache_path()
+        if not os.path.exists(self.output_file):
+            return set()
+
+        try:
+            if os.path.exists(cache_path) and \
+                    os.path.getmtime(cache_path) >= os.path.getmtime(self.output_file):
+                with open(cache_path, 'r', encoding='utf-8') as cachefile:
+                    return {line for line in cachefile.read().splitlines() if line}
+        except Exception as e:
+            print(f"Error reading URL cache: {e}")
+
+        urls = self.get_existing_urls()
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as cachefile:
+                # Trailing newline per URL so later appends start a fresh line
+                cachefile.writelines(f"{url}\n" for url in urls)
+        except Exception as e:
+            print(f"Error writing URL cache: {e}")
+        return urls
+
+    def update_url_cache(self, urls, mode: str = 'a'):
+        """
+        Keep the URL sidecar cache in sync after a CSV write.
+
+        Args:
+            urls: Iterable of URLs just written to the CSV
+            mode: 'a' after an append to the CSV, 'w' after a rewrite
+        """
+        try:
+            with open(self._url_cache_path(), mode, encoding='utf-8') as cachefile:
+                cachefile.writelines(f"{url}\n" for url in urls if url)
+        except Exception as e:
+            print(f"Error updating URL cache: {e}")
+
     def get_existing_urls(self) -> set:
         """
         Get set of existing job URLs from CSV to avoid duplicates.
@@ -0,0 +1,67 @@
+"""Structured job record for the post-scrape pipeline."""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """
+    A single scraped job with its scoring fields.
+
+    Slot-based attribute access is faster than repeated dict.get() calls in
+    the dedup/scoring hot loops and each record uses less memory than a dict.
+    Scrapers still hand over plain dicts; convert at the aggregation boundary
+    with from_dict() and back with to_dict() for the CSV writer.
+    """
+
+    title: str = ''
+    company: str = ''
+    location: str = ''
+    url: str = ''
+    experience: str = ''
+    description: str = ''
+    posted_date: str = ''
+    source: str = ''
+    # Scoring fields, filled in by JobScorer
+    priority_score: int = 0
+    days_since_posted: Optional[int] = None
+    freshness: str = ''
+    salary: Optional[str] = None
+    deadline: Optional[str] = None
+    days_until_deadline: Optional[int] = None
+    skills_match_pct: float = 0.0
+
+    @classmethod
+    def from_dict(cls, job: Dict) -> 'JobRecord':
+        """Build a record from a scraper's job dict."""
+        return cls(
+            title=str(job.get('title', '') or ''),
+            company=str(job.get('company', '') or ''),
+            location=str(job.get('location', '') or ''),
+            url=str(job.get('url', '') or '').strip(),
+            experience=str(job.get('experience', '') or ''),
+            description=str(job.get('description', '') or ''),
+            posted_date=str(job.get('posted_date', '') or ''),
+            source=str(job.get('source', '') or ''),
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert back to the dict shape the CSV writer expects."""
+        return {
+            'title': self.title,
+            'company': self.company,
+            'location': self.location,
+            'url': self.url,
+            'experience': self.experience,
+            'description': self.description,
+            'posted_date': self.posted_date,
+            'source': self.source,
+            'priority_score': self.priority_score,
+            'days_since_posted': self.days_since_posted,
+            'freshness': self.freshness,
+            'salary': self.salary,
+            'deadline': self.deadline,
+            'days_until_deadline': self.days_until_deadline,
+            'skills_match_pct': self.skills_match_pct,
+        }
@@ -9,6 +9,7 @@ from typing import Dict, Optional, List
 from utils.salary_extractor import SalaryExtractor
 from utils.deadline_extractor import DeadlineExtractor
 from utils.config import YOUR_SKILLS
+from utils import json_io
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +35,7 @@ class JobScorer:
             if not os.path.exists(filepath):
                 logger.warning(f"Companies metadata file not found: {filepath}. Using empty dict.")
                 return {}
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return json_io.load_file(filepath)
         except Exception as e:
             logger.warning(f"Error loading companies metadata: {e}. Using empty dict.")
             return {}
@@ -219,7 +219,33 @@ class JobScorer:
         job_description = str(job.get('description', '') or '')
         company = str(job.get('company', '') or '')
         posted_date = str(job.get('posted_date', '') or '')
-        
+
+        return self._score(job_title, job_description, company, posted_date)
+
+    def score_record(self, record) -> Dict:
+        """
+        Score a JobRecord in place.
+
+        Args:
+            record: JobRecord instance (utils.job_record)
+
+        Returns:
+            Score breakdown dictionary (same shape as calculate_score)
+        """
+        score_data = self._score(
+            record.title, record.description, record.company, record.posted_date
+        )
+        record.priority_score = score_data['score']
+        record.days_since_posted = score_data['days_since_posted']
+        record.freshness = score_data['freshness']
+        record.salary = score_data['salary']
+        record.deadline = score_data['deadline']
+        record.days_until_deadline = score_data['days_until_deadline']
+        record.skills_match_pct = score_data['skills_match_pct']
+        return score_data
+
+    def _score(self, job_title: str, job_description: str, company: str, posted_date: str) -> Dict:
+        """Shared scoring implementation for dicts and records."""
         score = 0
         breakdown = {}
         
@@ -0,0 +1,44 @@
+"""JSON helpers that prefer orjson when available.
+
+orjson parses and serializes at C speed (several times faster than the
+stdlib json module on large documents). It stays an optional dependency:
+when it is not installed everything falls back to stdlib json.
+"""
+
+from typing import Any
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data) -> Any:
+    """Parse JSON from a str or bytes object."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def load_file(path: str) -> Any:
+    """Parse JSON from a file path."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize an object to a JSON string."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dump_file(obj: Any, path: str, indent: bool = False) -> None:
+    """Serialize an object as JSON to a file path."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(dumps(obj, indent=indent))
@@ -0,0 +1,83 @@
+"""Rolling seen-URL state so repeat runs skip already-processed job cards.
+
+The board scrapers resolve a card's URL early and consult this state
+before doing the rest of the extraction work; on warm runs most cards
+are repeats, so the per-card find/regex cost drops proportionally.
+"""
+
+import logging
+import os
+import threading
+from datetime import date, timedelta
+from typing import Dict
+
+from utils import json_io
+from utils.config import (
+    SEEN_URLS_ENABLED,
+    SEEN_URLS_FILE,
+    SEEN_URLS_MAX_AGE_DAYS,
+)
+
+logger = logging.getLogger(__name__)
+
+# One state file holds every source's URL map; scrapers save concurrently
+# from the shared pool, so the read-modify-write is serialized here
+_FILE_LOCK = threading.Lock()
+
+
+def _load_state() -> Dict:
+    try:
+        if os.path.exists(SEEN_URLS_FILE):
+            data = json_io.load_file(SEEN_URLS_FILE)
+            if isinstance(data, dict):
+                return data
+    except Exception as e:
+        logger.warning("Could not load seen-URL state: %s", e)
+    return {}
+
+
+class SeenUrls:
+    """Per-source set of job URLs seen within the rolling window.
+
+    Each URL maps to the date it was last seen. Re-seeing a URL refreshes
+    its stamp, so a live listing stays suppressed run after run and only
+    expires once it has been gone for SEEN_URLS_MAX_AGE_DAYS.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.enabled = SEEN_URLS_ENABLED
+        self._lock = threading.Lock()
+        self._dates: Dict[str, str] = {}
+        if self.enabled:
+            entry = _load_state().get(source)
+            if isinstance(entry, dict):
+                self._dates = {str(k): str(v) for k, v in entry.items()}
+
+    def check_and_mark(self, url: str) -> bool:
+        """Return whether url is already known, stamping it with today."""
+        if not self.enabled or not url:
+            return False
+        with self._lock:
+            seen = url in self._dates
+            self._dates[url] = date.today().isoformat()
+        return seen
+
+    def save(self) -> None:
+        """Prune stale entries and rewrite this source's slice of the state."""
+        if not self.enabled:
+            return
+        cutoff = (date.today() - timedelta(days=SEEN_URLS_MAX_AGE_DAYS)).isoformat()
+        with self._lock:
+            fresh = {u: d for u, d in self._dates.items() if d >= cutoff}
+            self._dates = fresh
+        with _FILE_LOCK:
+            state = _load_state()
+            state[self.source] = fresh
+            try:
+                out_dir = os.path.dirname(SEEN_URLS_FILE)
+                if out_dir:
+                    os.makedirs(out_dir, exist_ok=True)
+                json_io.dump_file(state, SEEN_URLS_FILE)
+            except Exception as e:
+                logger.warning("Could not save seen-URL state: %s", e)